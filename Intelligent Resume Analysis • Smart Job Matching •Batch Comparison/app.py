@@ -1,7 +1,12 @@
+import os
 import streamlit as st
-from text_extractor import extract_text_from_pdf, extract_text_from_txt, clean_text
+from text_extractor import extract_text_from_bytes, clean_text
 from nlp_processor import ResumeProcessor
-from matcher import JobMatcher
+from matcher import JobMatcher, BatchJobMatcher
+from batch_processor import read_upload, process_uploads, NLP_BATCH_SIZE, NLP_PROCESSES, PDF_WORKERS
+from resume_cache import ResumeCache, content_key
+from profiling import StageProfiler
+from dedup import NearDuplicateIndex
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
@@ -91,8 +96,42 @@ st.markdown("""
     </style>
     """, unsafe_allow_html=True)
 
+@st.cache_resource
+def get_profiler():
+    """Pipeline stage timings, aggregated across reruns and sessions"""
+    return StageProfiler()
+
+profiler = get_profiler()
+
 # Initialize processor
-processor = ResumeProcessor()
+processor = ResumeProcessor(profiler=profiler)
+
+@st.cache_resource
+def get_resume_cache():
+    """One cache per server process, shared across reruns, tabs and sessions"""
+    return ResumeCache(
+        max_entries=int(os.environ.get("RESUME_CACHE_ENTRIES", "256")),
+        disk_dir=os.environ.get("RESUME_CACHE_DIR"),
+        max_disk_bytes=int(os.environ.get("RESUME_CACHE_MAX_MB", "200")) * 1024 * 1024
+    )
+
+resume_cache = get_resume_cache()
+
+def analyze_upload(uploaded_file):
+    """Return (cleaned text, process_resume output), parsing each distinct file once"""
+    data = uploaded_file.getvalue()
+
+    def compute():
+        # Large PDFs are split across PDF_WORKERS processes by page range
+        is_pdf = uploaded_file.type == "application/pdf"
+        with profiler.stage("extract_text"):
+            text = extract_text_from_bytes(data, is_pdf, workers=PDF_WORKERS)
+        with profiler.stage("clean_text"):
+            text = clean_text(text)
+        return {"text": text, "results": processor.process_resume(text)}
+
+    entry = resume_cache.get_or_compute(content_key(data), compute)
+    return entry["text"], entry["results"]
 
 # Header section
 col1, col2, col3 = st.columns([1, 2, 1])
@@ -130,19 +169,11 @@ with tab1:
         """)
     
     if uploaded_file:
-        # Extract text
-        if uploaded_file.type == "application/pdf":
-            resume_text = extract_text_from_pdf(uploaded_file)
-        else:
-            resume_text = extract_text_from_txt(uploaded_file)
-        
-        resume_text = clean_text(resume_text)
+        # Show loading animation
+        with st.spinner("🔍 Analyzing resume..."):
+            resume_text, results = analyze_upload(uploaded_file)
         
         if resume_text:
-            # Show loading animation
-            with st.spinner("🔍 Analyzing resume..."):
-                results = processor.process_resume(resume_text)
-            
             # Success message
             st.success("✅ Resume analyzed successfully!")
             
@@ -287,21 +318,14 @@ with tab2:
     
     if resume_file and job_desc:
         with st.spinner("🔄 Matching resume to job description..."):
-            # Extract resume text
-            if resume_file.type == "application/pdf":
-                resume_text = extract_text_from_pdf(resume_file)
-            else:
-                resume_text = extract_text_from_txt(resume_file)
-            
-            resume_text = clean_text(resume_text)
-            
-            # Process resume
-            results = processor.process_resume(resume_text)
+            # Extract and process resume (cached by file content)
+            resume_text, results = analyze_upload(resume_file)
             resume_skills = results["skills"]
             
             # Match
-            matcher = JobMatcher(resume_skills, job_desc)
-            match_report = matcher.get_match_report()
+            with profiler.stage("job_match"):
+                matcher = JobMatcher(resume_skills, job_desc)
+                match_report = matcher.get_match_report()
         
         st.success("✅ Matching complete!")
         
@@ -375,34 +399,98 @@ with tab3:
     )
     
     if job_desc and uploaded_files:
-        with st.spinner(f"📊 Analyzing {len(uploaded_files)} resumes..."):
-            results_list = []
-            
-            for resume_file in uploaded_files:
-                # Extract text
-                if resume_file.type == "application/pdf":
-                    resume_text = extract_text_from_pdf(resume_file)
-                else:
-                    resume_text = extract_text_from_txt(resume_file)
-                
-                resume_text = clean_text(resume_text)
-                parsed = processor.process_resume(resume_text)
-                
-                # Match
-                matcher = JobMatcher(parsed["skills"], job_desc)
-                match_report = matcher.get_match_report()
-                
-                results_list.append({
-                    "Resume": resume_file.name,
+        # Parses and near-duplicate groups persist across reruns, keyed by file
+        # name and content hash, so only newly added files are processed and
+        # removed files simply drop out
+        batch_parsed = st.session_state.setdefault("batch_parsed", {})
+        batch_dedup = st.session_state.setdefault("batch_dedup", NearDuplicateIndex())
+        batch_scores = st.session_state.setdefault("batch_scores", {"job": None, "rows": {}})
+        
+        uploads = {}
+        for resume_file in uploaded_files:
+            upload = read_upload(resume_file)
+            uploads[f"{upload[0]}:{content_key(upload[1])}"] = upload
+        
+        for key in [key for key in batch_dedup.keys() if key not in uploads]:
+            batch_dedup.remove(key)
+        for key in [key for key in batch_parsed if key not in uploads]:
+            del batch_parsed[key]
+            batch_scores["rows"].pop(key, None)
+        
+        # A new job description re-scores the kept parses without re-parsing
+        if batch_scores["job"] != job_desc:
+            batch_scores["job"] = job_desc
+            batch_scores["rows"] = {}
+        rows = batch_scores["rows"]
+        
+        # The job description is vectorized once; parsed resumes are scored
+        # in chunks with one sparse pass each
+        batch_matcher = BatchJobMatcher(job_desc)
+        live_table = st.empty()
+        
+        def ranking_frame():
+            # Near-duplicate uploads are listed with the upload they were collapsed into
+            df = pd.DataFrame([
+                {**row, "Duplicates": ", ".join(uploads[dup][0] for dup in batch_dedup.duplicates(key))}
+                for key, row in rows.items()
+            ])
+            return df.sort_values("Overall Score", ascending=False)
+        
+        def score(keys):
+            with profiler.stage("batch_job_match"):
+                reports = batch_matcher.get_match_reports([batch_parsed[key]["parsed"]["skills"] for key in keys])
+            for key, match_report in zip(keys, reports):
+                rows[key] = {
+                    "Resume": batch_parsed[key]["name"],
                     "Skill Match %": match_report["skill_match"]["match_percentage"],
                     "Semantic Score": match_report["semantic_similarity"],
                     "Overall Score": match_report["overall_score"]
-                })
+                }
+            live_table.dataframe(ranking_frame(), use_container_width=True)
         
-        st.success(f"✅ Analyzed {len(uploaded_files)} resumes!")
+        new_uploads = [(key, upload) for key, upload in uploads.items() if key not in batch_parsed]
+        if new_uploads:
+            total = len(new_uploads)
+            progress = st.progress(0.0, text=f"📊 Analyzing 0/{total} new resumes...")
+            pending = []
+            # Files left half-processed by an interrupted rerun are indexed afresh
+            for key, _ in new_uploads:
+                batch_dedup.remove(key)
+            
+            # PDFs are extracted in a process pool and parsed with nlp.pipe;
+            # resumes are ranked as their parses come back
+            results = process_uploads(
+                processor, [upload for _, upload in new_uploads], resume_cache,
+                dedup=batch_dedup, keys=[key for key, _ in new_uploads],
+                n_process=NLP_PROCESSES, batch_size=NLP_BATCH_SIZE
+            )
+            for done, (key, parsed, duplicate_of) in enumerate(results, 1):
+                progress.progress(done / total, text=f"📊 Analyzing {done}/{total} new resumes...")
+                if parsed is None:
+                    parsed = batch_parsed[duplicate_of]["parsed"]
+                batch_parsed[key] = {"name": uploads[key][0], "parsed": parsed}
+                if duplicate_of is None:
+                    pending.append(key)
+                if len(pending) >= NLP_BATCH_SIZE:
+                    score(pending)
+                    pending.clear()
+            progress.empty()
+        
+        # Everything not yet scored against this job: new files, every kept
+        # parse after a job description edit, and promoted duplicates
+        unscored = [key for key in batch_parsed if batch_dedup.representative(key) == key and key not in rows]
+        for start in range(0, len(unscored), NLP_BATCH_SIZE):
+            score(unscored[start:start + NLP_BATCH_SIZE])
+        
+        live_table.empty()
+        collapsed = len(uploads) - len(rows)
+        message = f"✅ Analyzed {len(uploads)} resumes ({len(new_uploads)} new"
+        if collapsed:
+            message += f", {collapsed} near-duplicates collapsed"
+        st.success(message + ")!")
         
         # Display as table
-        df = pd.DataFrame(results_list).sort_values("Overall Score", ascending=False)
+        df = ranking_frame()
         
         # Style dataframe
         st.markdown("### 🏆 Ranking Results")
@@ -453,6 +541,29 @@ with tab3:
             </div>
         """, unsafe_allow_html=True)
 
+# Sidebar: resume cache statistics
+with st.sidebar:
+    st.markdown("### ⚡ Resume Cache")
+    cache_stats = resume_cache.stats()
+    col1, col2 = st.columns(2)
+    col1.metric("Hits", cache_stats["hits"])
+    col2.metric("Misses", cache_stats["misses"])
+    st.caption(
+        f"Hit rate {cache_stats['hit_rate']}% • {cache_stats['entries']} in memory"
+        + (f" • {cache_stats['disk_hits']} from disk" if resume_cache.disk_dir else "")
+    )
+
+# Sidebar: pipeline stage timings
+with st.sidebar:
+    if st.checkbox("⏱️ Show pipeline timings"):
+        stage_rows = profiler.summary()
+        if stage_rows:
+            st.dataframe(pd.DataFrame(stage_rows).set_index("stage"), use_container_width=True)
+        else:
+            st.caption("No resumes processed yet")
+        if st.button("Reset timings"):
+            profiler.reset()
+
 # Footer
 st.markdown("""
     <div style='text-align: center; margin-top: 50px; padding: 20px; color: #999; border-top: 2px solid rgba(102, 126, 234, 0.3);'>
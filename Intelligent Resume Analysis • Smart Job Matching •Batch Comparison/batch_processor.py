@@ -0,0 +1,117 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from text_extractor import extract_text_from_bytes, clean_text
+from resume_cache import content_key
+
+# Defaults for the Batch Compare tab; PDF parsing is CPU bound and scales with cores.
+# Each extra spaCy process loads its own model copy, so RESUME_NLP_PROCESSES
+# pays off for batches of dozens of resumes on a machine with spare cores.
+PDF_WORKERS = int(os.environ.get("RESUME_PDF_WORKERS", min(8, os.cpu_count() or 1)))
+NLP_PROCESSES = int(os.environ.get("RESUME_NLP_PROCESSES", "1"))
+NLP_BATCH_SIZE = int(os.environ.get("RESUME_NLP_BATCH_SIZE", "16"))
+
+
+def read_upload(uploaded_file):
+    """Turn a Streamlit upload into a picklable (name, bytes, is_pdf) tuple"""
+    return (
+        uploaded_file.name,
+        uploaded_file.getvalue(),
+        uploaded_file.type == "application/pdf"
+    )
+
+
+def _extract_upload(index, data, is_pdf):
+    """Worker: raw upload bytes -> cleaned resume text, with stage timings"""
+    start = time.perf_counter()
+    text = extract_text_from_bytes(data, is_pdf)
+    extracted = time.perf_counter()
+    text = clean_text(text)
+    timings = {"extract_text": extracted - start, "clean_text": time.perf_counter() - extracted}
+    return index, text, timings
+
+
+def extract_texts(uploads, max_workers=PDF_WORKERS):
+    """Yield (index, cleaned text, timings) for each upload as soon as it is extracted"""
+    uploads = list(uploads)
+    if max_workers <= 1 or len(uploads) <= 1:
+        for index, (_, data, is_pdf) in enumerate(uploads):
+            yield _extract_upload(index, data, is_pdf)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(uploads))) as pool:
+        futures = [
+            pool.submit(_extract_upload, index, data, is_pdf)
+            for index, (_, data, is_pdf) in enumerate(uploads)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def process_uploads(processor, uploads, cache=None, dedup=None, keys=None, pdf_workers=PDF_WORKERS,
+                    n_process=NLP_PROCESSES, batch_size=NLP_BATCH_SIZE):
+    """Extract and parse a batch of uploads, yielding (key, parsed, duplicate_of)
+
+    key is the upload's entry in `keys`, or its name by default. Uploads
+    already in `cache` are yielded first. The rest are extracted in a process
+    pool that feeds spaCy's nlp.pipe, so parsing starts on the first finished
+    file instead of waiting for all of them.
+
+    With a dedup.NearDuplicateIndex, each extracted text is checked before
+    parsing; a near-duplicate is not parsed and is yielded with its
+    representative's key as duplicate_of (None for every other upload) and
+    that representative's results. If the representative was indexed by an
+    earlier call, parsed is None and the caller supplies the results it kept.
+    """
+    uploads = list(uploads)
+    if keys is None:
+        keys = [name for name, _, _ in uploads]
+    batch_keys = set(keys)
+    pending = []
+    parsed_by_key = {}
+    for key, upload in zip(keys, uploads):
+        _, data, _ = upload
+        entry = cache.get(content_key(data)) if cache is not None else None
+        if entry is None:
+            pending.append((key, upload))
+            continue
+        representative = dedup.add(key, entry["text"]) if dedup is not None else key
+        if representative == key:
+            parsed_by_key[key] = entry["results"]
+            yield key, entry["results"], None
+        else:
+            yield key, parsed_by_key.get(representative), representative
+
+    texts = {}
+    waiting = []
+
+    def items():
+        for position, text, timings in extract_texts([upload for _, upload in pending], pdf_workers):
+            for stage, seconds in timings.items():
+                processor.profiler.record(stage, seconds)
+            key = pending[position][0]
+            representative = dedup.add(key, text) if dedup is not None else key
+            if representative != key:
+                waiting.append((key, representative))
+                continue
+            texts[key] = text
+            yield text, position
+
+    def ready_duplicates():
+        for entry in list(waiting):
+            key, representative = entry
+            if representative in parsed_by_key or representative not in batch_keys:
+                waiting.remove(entry)
+                yield key, parsed_by_key.get(representative), representative
+
+    # Fewer texts than one batch would all go to a single worker anyway
+    n_process = n_process if len(pending) > batch_size else 1
+    for position, parsed in processor.process_batch(items(), n_process=n_process, batch_size=batch_size):
+        key, (_, data, _) = pending[position]
+        text = texts.pop(key)
+        if cache is not None:
+            cache.put(content_key(data), {"text": text, "results": parsed})
+        parsed_by_key[key] = parsed
+        yield key, parsed, None
+        yield from ready_duplicates()
+    yield from ready_duplicates()
@@ -0,0 +1,576 @@
+"""Benchmarks for the resume processing pipeline.
+
+Run with:  python benchmark.py parse --resumes 200
+           python benchmark.py skills --sizes 60 1000 30000
+           python benchmark.py index --candidates 50000
+           python benchmark.py vectors --resumes 20000
+           python benchmark.py stages --json stages.json [--compare baseline.json]
+           python benchmark.py matrix --resumes 5000 --jobs 200
+           python benchmark.py taxonomy --size 30000
+           python benchmark.py dedup --resumes 5000
+           python benchmark.py contacts --resumes 1000
+           python benchmark.py coldstart --runs 5
+"""
+import argparse
+import io
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+from skills_database import SKILLS_DB, EDUCATION_DB
+
+FIRST_NAMES = ["Ada", "Tunde", "Maria", "Chen", "Priya", "James", "Fatima", "Lucas"]
+LAST_NAMES = ["Okafor", "Smith", "Garcia", "Wang", "Patel", "Brown", "Bello", "Silva"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Analytics", "Stark Industries", "Wayne Enterprises"]
+ROLES = ["Software Engineer", "Data Scientist", "DevOps Engineer", "Product Manager", "ML Engineer"]
+MONTHS = ["January", "February", "March", "April", "May", "June",
+          "July", "August", "September", "October", "November", "December"]
+VERBS = ["Developed", "Led", "Managed", "Designed", "Implemented", "Deployed", "Architected"]
+
+
+def synthetic_resume(rng, sections=3):
+    """Build a plausible resume with the given number of job sections"""
+    all_skills = [skill for skills in SKILLS_DB.values() for skill in skills]
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name,
+        f"{name.lower().replace(' ', '.')}@example.com | +1 (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        f"Skills: {', '.join(rng.sample(all_skills, 12))}",
+        f"Education: {rng.choice(EDUCATION_DB[:4])} of Science in {rng.choice(EDUCATION_DB[5:])}, "
+        f"University of Lagos, {rng.randint(2005, 2018)}",
+    ]
+    for _ in range(sections):
+        start = rng.randint(2010, 2022)
+        lines.append(
+            f"{rng.choice(ROLES)} at {rng.choice(COMPANIES)}, "
+            f"{rng.choice(MONTHS)} {start} - {rng.choice(['Present', MONTHS[rng.randint(0, 11)] + ' ' + str(start + 2)])}."
+        )
+        for _ in range(4):
+            lines.append(
+                f"{rng.choice(VERBS)} a {rng.choice(all_skills)} platform with "
+                f"{rng.choice(all_skills)} and {rng.choice(all_skills)} that served {rng.randint(2, 90)} teams "
+                f"and gained years of experience in {rng.choice(all_skills)}."
+            )
+    return " ".join(lines)
+
+
+def synthetic_corpus(count, sections=3, seed=0):
+    """Deterministic list of synthetic resumes"""
+    rng = random.Random(seed)
+    return [synthetic_resume(rng, sections) for _ in range(count)]
+
+
+def synthetic_pdf(text, chars_per_line=90, lines_per_page=50):
+    """Minimal multi-page PDF (Helvetica text) so extraction can be timed"""
+    words, lines, line = text.split(), [], ""
+    for word in words:
+        if line and len(line) + len(word) + 1 > chars_per_line:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}".strip()
+    lines.append(line)
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+
+    def escape(value):
+        return value.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    font_id = 3 + 2 * len(pages)
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{3 + 2 * i} 0 R' for i in range(len(pages)))}] "
+        f"/Count {len(pages)} >>"
+    ]
+    for i, page_lines in enumerate(pages):
+        content = "BT /F1 10 Tf 40 760 Td 14 TL " + " ".join(f"({escape(l)}) '" for l in page_lines) + " ET"
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>")
+        objects.append(f"<< /Length {len(content)} >>\nstream\n{content}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    pdf, offsets = "%PDF-1.4\n", []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n{body}\nendobj\n"
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF"
+    return pdf.encode("latin-1", errors="replace")
+
+
+def _time_it(fn, corpus):
+    start = time.perf_counter()
+    results = [fn(text) for text in corpus]
+    return time.perf_counter() - start, results
+
+
+def bench_parse(args):
+    """Compare one spaCy parse per resume against one parse per extractor"""
+    from nlp_processor import ResumeProcessor
+
+    processor = ResumeProcessor()
+    corpus = synthetic_corpus(args.resumes, args.sections)
+
+    def per_extractor(text):
+        # The pre-shared-Doc behaviour: every extractor parses on its own
+        return {
+            "skills": processor.extract_skills(text),
+            "education": processor.extract_education(text),
+            "experience": processor.extract_experience(text),
+            "entities": processor.extract_entities(text),
+            "email": processor.extract_email(text),
+            "phone": processor.extract_phone(text),
+            "dates": processor.extract_dates(text)
+        }
+
+    processor.process_resume(corpus[0])  # warm up the pipeline
+    separate_time, separate = _time_it(per_extractor, corpus)
+    shared_time, shared = _time_it(processor.process_resume, corpus)
+
+    identical = all(
+        {k: sorted(map(str, v)) if isinstance(v, list) else v for k, v in a.items()} ==
+        {k: sorted(map(str, v)) if isinstance(v, list) else v for k, v in b.items()}
+        for a, b in zip(separate, shared)
+    )
+    print(f"Resumes: {len(corpus)} ({args.sections} job sections each)")
+    print(f"Parse per extractor: {separate_time:.2f}s ({len(corpus) / separate_time:.1f} docs/sec)")
+    print(f"Shared Doc:          {shared_time:.2f}s ({len(corpus) / shared_time:.1f} docs/sec)")
+    print(f"Speedup: {separate_time / shared_time:.2f}x, identical output: {identical}")
+
+
+def synthetic_taxonomy(size, seed=0):
+    """SKILLS_DB padded with generated multi-word terms up to `size` skills"""
+    rng = random.Random(seed)
+    words = ["data", "cloud", "platform", "systems", "network", "analysis", "design",
+             "security", "mobile", "quantum", "embedded", "pipeline", "graph", "edge"]
+    taxonomy = {category: list(skills) for category, skills in SKILLS_DB.items()}
+    generated = taxonomy.setdefault("Generated", [])
+    seen = {skill.lower() for skills in taxonomy.values() for skill in skills}
+    while len(seen) < size:
+        term = " ".join(rng.sample(words, rng.randint(1, 3))) + f" {rng.randint(0, 99999)}"
+        if term not in seen:
+            seen.add(term)
+            generated.append(term)
+    return taxonomy
+
+
+def bench_skills(args):
+    """Skill lookup throughput as the taxonomy grows"""
+    from skill_matcher import SkillMatcher
+
+    corpus = synthetic_corpus(args.resumes, args.sections)
+    chars = sum(len(text) for text in corpus)
+    print(f"Resumes: {len(corpus)} ({chars / len(corpus):.0f} chars avg)")
+    print(f"{'skills':>8} {'compile':>9} {'matcher docs/sec':>17} {'per-skill regex docs/sec':>25}")
+
+    for size in args.sizes:
+        taxonomy = synthetic_taxonomy(size)
+        start = time.perf_counter()
+        matcher = SkillMatcher(taxonomy)
+        compile_time = time.perf_counter() - start
+        matcher_time, _ = _time_it(matcher.match_by_category, corpus)
+
+        def per_skill_regex(text):
+            # The previous extract_skills: one regex per skill per call
+            text_lower = text.lower()
+            return {category: [skill for skill in skills
+                               if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower)]
+                    for category, skills in taxonomy.items()}
+
+        if size <= args.max_regex_size:
+            regex_time, _ = _time_it(per_skill_regex, corpus)
+            regex_rate = f"{len(corpus) / regex_time:25.1f}"
+        else:
+            regex_rate = f"{'skipped':>25}"
+        print(f"{len(matcher):8d} {compile_time * 1000:7.1f}ms {len(corpus) / matcher_time:17.1f} {regex_rate}")
+
+
+def bench_index(args):
+    """Build a candidate index and time top-K queries against it"""
+    from candidate_index import CandidateIndex
+
+    rng = random.Random(0)
+    all_skills = [skill for skills in SKILLS_DB.values() for skill in skills]
+    with tempfile.TemporaryDirectory() as tmp:
+        index = CandidateIndex(os.path.join(tmp, "candidates.db"))
+        start = time.perf_counter()
+        index.add_many(
+            (f"candidate-{i}", rng.sample(all_skills, rng.randint(3, 20)))
+            for i in range(args.candidates)
+        )
+        print(f"Indexed {len(index)} candidates in {time.perf_counter() - start:.2f}s")
+
+        jobs = [" ".join(rng.sample(all_skills, rng.randint(3, 12))) for _ in range(args.queries)]
+        index.top_candidates(jobs[0], args.k)  # materialize posting arrays
+        timings = []
+        for job in jobs:
+            start = time.perf_counter()
+            index.top_candidates(job, args.k)
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        print(f"top-{args.k} query: p50 {timings[len(timings) // 2]:.2f}ms, "
+              f"p95 {timings[int(len(timings) * 0.95)]:.2f}ms")
+        index.close()
+
+
+def bench_matrix(args):
+    """Resume x job score matrix time at recruiting-team scale"""
+    from matcher import MultiJobMatcher
+
+    rng = random.Random(0)
+    all_skills = [skill for skills in SKILLS_DB.values() for skill in skills]
+    resumes = [{"Skills": rng.sample(all_skills, rng.randint(3, 20))} for _ in range(args.resumes)]
+    jobs = [
+        f"{rng.choice(ROLES)} with {', '.join(rng.sample(all_skills, rng.randint(3, 12)))} "
+        f"and experience leading data platform teams"
+        for _ in range(args.jobs)
+    ]
+
+    start = time.perf_counter()
+    matcher = MultiJobMatcher(jobs)
+    prepared = time.perf_counter()
+    scores = matcher.score_matrix(resumes)
+    scored = time.perf_counter()
+    matcher.top_candidates(scores, args.k)
+    done = time.perf_counter()
+    print(f"{args.resumes} resumes x {args.jobs} jobs")
+    print(f"prepare jobs {(prepared - start) * 1000:.0f}ms, score matrix {(scored - prepared) * 1000:.0f}ms, "
+          f"top-{args.k} {(done - scored) * 1000:.0f}ms, total {done - start:.2f}s")
+
+
+def bench_vectors(args):
+    """Build, append to and query the memory-mapped resume vector store"""
+    from vector_store import ResumeVectorStore
+
+    corpus = synthetic_corpus(args.resumes + args.append, args.sections)
+    ids = [f"resume-{i}" for i in range(len(corpus))]
+    rng = random.Random(1)
+    all_skills = [skill for skills in SKILLS_DB.values() for skill in skills]
+    jobs = [f"{rng.choice(ROLES)} with {', '.join(rng.sample(all_skills, 8))}" for _ in range(args.queries)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        ResumeVectorStore.build(tmp, corpus[:args.resumes], ids[:args.resumes])
+        built = time.perf_counter()
+        store = ResumeVectorStore(tmp)
+        opened = time.perf_counter()
+        store.append(corpus[args.resumes:], ids[args.resumes:])
+        appended = time.perf_counter()
+        latencies = []
+        for job in jobs:
+            query_start = time.perf_counter()
+            store.query(job, args.k)
+            latencies.append(time.perf_counter() - query_start)
+
+    latencies.sort()
+    print(f"Resumes: {args.resumes} fitted + {args.append} appended, vocabulary {len(store.vectorizer.vocabulary_)}")
+    print(f"build {built - start:.2f}s, open {(opened - built) * 1000:.1f}ms, append {appended - opened:.2f}s")
+    print(f"top-{args.k} query over {len(store)} resumes: p50 {latencies[len(latencies) // 2] * 1000:.2f}ms, "
+          f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.2f}ms")
+
+
+def bench_stages(args):
+    """Per-stage p50/p95 latency and docs/sec across resume lengths"""
+    from matcher import JobMatcher
+    from nlp_processor import ResumeProcessor
+    from profiling import StageProfiler
+    from text_extractor import extract_text_from_pdf, clean_text
+
+    job = ("Senior Data Scientist: Python, SQL, Machine Learning, Pandas, AWS and Docker; "
+           "experience leading teams and communicating results")
+    report = {}
+    for sections in args.sections:
+        profiler = StageProfiler(max_samples=args.resumes)
+        processor = ResumeProcessor(profiler=profiler)
+        corpus = synthetic_corpus(args.resumes, sections, seed=sections)
+        pdfs = [synthetic_pdf(text) for text in corpus]
+        processor.process_resume(corpus[0])  # load the model outside the timings
+        profiler.reset()
+
+        for pdf in pdfs:
+            with profiler.stage("extract_text"):
+                text = extract_text_from_pdf(io.BytesIO(pdf))
+            with profiler.stage("clean_text"):
+                text = clean_text(text)
+            with profiler.stage("process_resume"):
+                parsed = processor.process_resume(text)
+            with profiler.stage("job_match"):
+                JobMatcher(parsed["skills"], job).get_match_report()
+
+        chars = sum(len(text) for text in corpus) // len(corpus)
+        report[f"{sections}_sections"] = {"chars": chars, "stages": profiler.summary()}
+        print(f"\n{sections} job sections (~{chars} chars), {len(corpus)} resumes")
+        print(f"{'stage':>20} {'p50 ms':>9} {'p95 ms':>9} {'docs/sec':>10}")
+        for row in report[f"{sections}_sections"]["stages"]:
+            print(f"{row['stage']:>20} {row['p50_ms']:9.2f} {row['p95_ms']:9.2f} {row['docs_per_sec']:10.1f}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print("\np50 change vs baseline (positive = slower)")
+        for length, result in report.items():
+            before = {row["stage"]: row for row in baseline.get(length, {}).get("stages", [])}
+            for row in result["stages"]:
+                if row["stage"] in before and before[row["stage"]]["p50_ms"]:
+                    change = (row["p50_ms"] / before[row["stage"]]["p50_ms"] - 1) * 100
+                    print(f"{length:>14} {row['stage']:>20} {change:+7.1f}%")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved {args.json}")
+
+
+LEGACY_PHONE_PATTERNS = [
+    r'\+?1?\s*\(?([0-9]{3})\)?[\s.-]?([0-9]{3})[\s.-]?([0-9]{4})',
+    r'\+234\s?([0-9]{10})',
+    r'0\d{10}',
+    r'\+?[\d\s\-\(\)]{10,15}'
+]
+LEGACY_DATE_PATTERNS = [
+    r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}\b',
+    r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b',
+    r'\b\d{1,2}[-/]\d{1,2}[-/]\d{4}\b',
+    r'\b(20|19)\d{2}[-–]\s*(present|current|ongoing)\b',
+]
+
+
+def legacy_contacts(text):
+    """The previous regex batteries of extract_email, extract_phone and extract_dates"""
+    emails = list(set(re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)))
+    phones = []
+    for pattern in LEGACY_PHONE_PATTERNS:
+        for phone in re.findall(pattern, text):
+            if isinstance(phone, tuple):
+                phone = ''.join(str(p) for p in phone if p)
+            if len(re.sub(r'\D', '', str(phone))) >= 10:
+                phones.append(str(phone))
+    dates = []
+    for pattern in LEGACY_DATE_PATTERNS:
+        dates.extend(re.findall(pattern, text, re.IGNORECASE))
+    return {"email": emails, "phone": list(set(phones)), "dates": list(set(dates))}
+
+
+# Formats the synthetic resumes don't use, each with something the old patterns found
+CONTACT_FIXTURE = (
+    "Ada Okafor ada.okafor@example.com Tel: 0803 123 4567 or 0805-246-8135, 08079876543, "
+    "+234 802 555 0199, +1 (555) 321-7654. Data Scientist, Jan 2020-Present. "
+    "ML Engineer, Feb 2017 - Present. Analyst 2015-Present, March 2014 to 01/02/2016."
+)
+
+
+def legacy_spans(text):
+    """Full matches of the previous phone and date patterns (findall returned only their groups)"""
+    phones = [match.group(0) for pattern in LEGACY_PHONE_PATTERNS for match in re.finditer(pattern, text)
+              if len(re.sub(r'\D', '', match.group(0))) >= 10]
+    dates = [match.group(0) for pattern in LEGACY_DATE_PATTERNS for match in re.finditer(pattern, text, re.IGNORECASE)]
+    return phones, dates
+
+
+def old_contacts_found(text, scanned):
+    """True if every old phone and date match is part of a scanned one"""
+    phones, dates = legacy_spans(text)
+    new_phones = [re.sub(r'\D', '', phone) for phone in scanned["phone"]]
+    new_dates = [date.lower() for date in scanned["dates"]]
+    return (all(any(re.sub(r'\D', '', old) in new for new in new_phones) for old in phones)
+            and all(any(old.lower() in new for new in new_dates) for old in dates))
+
+
+def bench_contacts(args):
+    """Single-pass contact scanner against the previous regex batteries"""
+    from contact_scanner import scan_contacts
+
+    corpus = synthetic_corpus(args.resumes, args.sections)
+    legacy_time, legacy = _time_it(legacy_contacts, corpus)
+    scan_time, scanned = _time_it(scan_contacts, corpus)
+
+    emails_identical = all(set(a["email"]) == set(b["email"]) for a, b in zip(legacy, scanned))
+    # Legacy phones are partly digit-only without the country code, so a
+    # scanned number counts as found if its digits end with a legacy one
+    phones_covered = all(
+        any(re.sub(r'\D', '', new).endswith(re.sub(r'\D', '', old)) for old in a["phone"])
+        for a, b in zip(legacy, scanned) for new in b["phone"]
+    )
+    assert phones_covered, "scanner found a phone the old patterns did not"
+    # And nothing the old patterns found is lost
+    assert all(old_contacts_found(text, result) for text, result in zip(corpus, scanned))
+    assert old_contacts_found(CONTACT_FIXTURE, scan_contacts(CONTACT_FIXTURE)), \
+        f"old matches lost on the fixture: {legacy_spans(CONTACT_FIXTURE)} vs {scan_contacts(CONTACT_FIXTURE)}"
+
+    print(f"Resumes: {len(corpus)} ({args.sections} job sections each)")
+    print(f"Regex batteries: {legacy_time:.3f}s ({len(corpus) / legacy_time:.1f} docs/sec)")
+    print(f"Single pass:     {scan_time:.3f}s ({len(corpus) / scan_time:.1f} docs/sec)")
+    print(f"Speedup: {legacy_time / scan_time:.2f}x, same emails: {emails_identical}, "
+          f"phones found by the old patterns: {phones_covered}, old phones and dates kept: True")
+
+
+def bench_taxonomy(args):
+    """Compile a large taxonomy file once, then reload its matcher artifact"""
+    import csv
+    from taxonomy import build_matcher, load_matcher
+
+    taxonomy = synthetic_taxonomy(args.size)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "taxonomy.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["category", "skill", "aliases"])
+            for category, skills in taxonomy.items():
+                for i, skill in enumerate(skills):
+                    writer.writerow([category, skill, f"alias {i} of {category}" if i % 3 == 0 else ""])
+
+        start = time.perf_counter()
+        matcher = build_matcher(path)
+        built = time.perf_counter()
+        reloaded = load_matcher(path)
+        loaded = time.perf_counter()
+        artifact_mb = os.path.getsize(path + ".matcher.pkl") / 1024 / 1024
+
+    text = synthetic_corpus(1)[0]
+    print(f"Taxonomy: {len(matcher)} skills, artifact {artifact_mb:.1f}MB")
+    print(f"compile {(built - start) * 1000:.0f}ms, reload {(loaded - built) * 1000:.0f}ms, "
+          f"same matches: {matcher.find(text) == reloaded.find(text)}")
+
+
+def bench_dedup(args):
+    """Near-duplicate grouping cost and recall on resumes with edited copies"""
+    from dedup import NearDuplicateIndex
+
+    rng = random.Random(2)
+    corpus = synthetic_corpus(args.resumes, args.sections)
+    texts, expected = [], {}
+    for i, text in enumerate(corpus):
+        texts.append((f"resume-{i}", text))
+        if rng.random() < args.duplicate_rate:
+            # A re-upload with a couple of small edits
+            edited = text.replace(" and ", " & ", 2) + f" References available on request {i}."
+            texts.append((f"resume-{i}-copy", edited))
+            expected[f"resume-{i}-copy"] = f"resume-{i}"
+    rng.shuffle(texts)
+
+    index = NearDuplicateIndex()
+    start = time.perf_counter()
+    found = {key: index.add(key, text) for key, text in texts}
+    elapsed = time.perf_counter() - start
+
+    # A copy shuffled in front of its original becomes the representative instead
+    caught = sum(found[copy] == original or found[original] == copy for copy, original in expected.items())
+    false_merges = sum(
+        key != representative and expected.get(key) != representative and expected.get(representative) != key
+        for key, representative in found.items()
+    )
+    print(f"Texts: {len(texts)} ({len(expected)} edited copies)")
+    print(f"{elapsed / len(texts) * 1000:.2f}ms per text, {len(texts) / elapsed:.0f} texts/sec")
+    print(f"copies collapsed: {caught}/{len(expected)}, unrelated merges: {false_merges}")
+
+
+# Runs in a fresh interpreter so import, model load and memory are all cold
+COLD_START_CHILD = """
+import resource, sys, time
+start = time.perf_counter()
+import nlp_processor
+if sys.argv[1] == "full":
+    # The previous behaviour: every component, loaded eagerly
+    import spacy
+    nlp_processor._nlp = spacy.load(nlp_processor.MODEL_NAME)
+processor = nlp_processor.ResumeProcessor()
+ready = time.perf_counter() - start
+processor.process_resume(sys.argv[2])
+first = time.perf_counter() - start
+print(ready, first, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def bench_coldstart(args):
+    """Import-to-first-result time and peak RSS: full eager vs lazy trimmed model"""
+    resume = synthetic_corpus(1, args.sections)[0]
+    print(f"{'mode':>8} {'import':>9} {'first result':>13} {'peak RSS':>10}")
+    for mode in ("full", "trimmed"):
+        runs = []
+        for _ in range(args.runs):
+            output = subprocess.run(
+                [sys.executable, "-c", COLD_START_CHILD, mode, resume],
+                capture_output=True, text=True, check=True,
+                cwd=os.path.dirname(os.path.abspath(__file__))
+            ).stdout.split()
+            runs.append([float(value) for value in output[-3:]])
+        ready, first, rss_kb = (sorted(column)[len(column) // 2] for column in zip(*runs))
+        print(f"{mode:>8} {ready * 1000:7.0f}ms {first * 1000:11.0f}ms {rss_kb / 1024:8.1f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resume pipeline benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    parse = sub.add_parser("parse", help="shared spaCy Doc vs one parse per extractor")
+    parse.add_argument("--resumes", type=int, default=200)
+    parse.add_argument("--sections", type=int, default=3)
+    parse.set_defaults(func=bench_parse)
+
+    skills = sub.add_parser("skills", help="skill matcher throughput vs taxonomy size")
+    skills.add_argument("--resumes", type=int, default=200)
+    skills.add_argument("--sections", type=int, default=3)
+    skills.add_argument("--sizes", type=int, nargs="+", default=[60, 1000, 10000, 30000])
+    skills.add_argument("--max-regex-size", type=int, default=1000,
+                        help="skip the per-skill regex baseline above this many skills")
+    skills.set_defaults(func=bench_skills)
+
+    index = sub.add_parser("index", help="candidate index top-K query latency")
+    index.add_argument("--candidates", type=int, default=50000)
+    index.add_argument("--queries", type=int, default=200)
+    index.add_argument("-k", type=int, default=10)
+    index.set_defaults(func=bench_index)
+
+    vectors = sub.add_parser("vectors", help="corpus TF-IDF vector store build/append/query")
+    vectors.add_argument("--resumes", type=int, default=20000)
+    vectors.add_argument("--append", type=int, default=1000)
+    vectors.add_argument("--sections", type=int, default=3)
+    vectors.add_argument("--queries", type=int, default=200)
+    vectors.add_argument("-k", type=int, default=10)
+    vectors.set_defaults(func=bench_vectors)
+
+    stages = sub.add_parser("stages", help="per-stage latency suite over resume lengths")
+    stages.add_argument("--resumes", type=int, default=100)
+    stages.add_argument("--sections", type=int, nargs="+", default=[1, 3, 10, 30])
+    stages.add_argument("--json", help="save results to this file")
+    stages.add_argument("--compare", help="baseline JSON from an earlier --json run")
+    stages.set_defaults(func=bench_stages)
+
+    matrix = sub.add_parser("matrix", help="N resumes x M jobs score matrix")
+    matrix.add_argument("--resumes", type=int, default=5000)
+    matrix.add_argument("--jobs", type=int, default=200)
+    matrix.add_argument("-k", type=int, default=10)
+    matrix.set_defaults(func=bench_matrix)
+
+    taxonomy = sub.add_parser("taxonomy", help="taxonomy matcher compile vs artifact reload")
+    taxonomy.add_argument("--size", type=int, default=30000)
+    taxonomy.set_defaults(func=bench_taxonomy)
+
+    dedup = sub.add_parser("dedup", help="MinHash/LSH near-duplicate grouping")
+    dedup.add_argument("--resumes", type=int, default=5000)
+    dedup.add_argument("--sections", type=int, default=3)
+    dedup.add_argument("--duplicate-rate", type=float, default=0.2)
+    dedup.set_defaults(func=bench_dedup)
+
+    contacts = sub.add_parser("contacts", help="single-pass email/phone/date scan vs regex batteries")
+    contacts.add_argument("--resumes", type=int, default=1000)
+    contacts.add_argument("--sections", type=int, default=10)
+    contacts.set_defaults(func=bench_contacts)
+
+    coldstart = sub.add_parser("coldstart", help="import-to-first-result time and memory")
+    coldstart.add_argument("--runs", type=int, default=5)
+    coldstart.add_argument("--sections", type=int, default=3)
+    coldstart.set_defaults(func=bench_coldstart)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
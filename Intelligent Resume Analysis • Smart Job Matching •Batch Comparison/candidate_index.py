@@ -0,0 +1,148 @@
+import json
+import sqlite3
+import numpy as np
+from matcher import flatten_skills
+from skill_matcher import skill_matcher
+
+
+class CandidateIndex:
+    """On-disk inverted index of candidate skills for fast job ranking.
+
+    Candidates and one posting per (skill, candidate) live in a SQLite file,
+    so adds and removals are single transactions with no rebuild. On open the
+    postings are loaded into per-skill row arrays; ranking a job is then one
+    bincount over the postings of the job's skills.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        with self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS candidates (
+                    row INTEGER PRIMARY KEY AUTOINCREMENT,
+                    candidate_id TEXT UNIQUE NOT NULL,
+                    skills TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS postings (
+                    skill TEXT NOT NULL,
+                    row INTEGER NOT NULL,
+                    PRIMARY KEY (skill, row)
+                );
+                CREATE INDEX IF NOT EXISTS postings_row ON postings(row);
+            """)
+        self._load()
+
+    def _load(self):
+        self._rows = dict(self._conn.execute("SELECT candidate_id, row FROM candidates"))
+        self._alive = np.zeros(max(self._rows.values(), default=0) + 1, dtype=bool)
+        self._alive[list(self._rows.values())] = True
+
+        self._new_postings = {}
+        for skill, row in self._conn.execute("SELECT skill, row FROM postings ORDER BY skill"):
+            self._new_postings.setdefault(skill, []).append(row)
+        self._postings = {}
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, candidate_id):
+        return candidate_id in self._rows
+
+    def add(self, candidate_id, resume_skills):
+        """Add or replace one candidate; resume_skills is a skills dict or list"""
+        self.add_many([(candidate_id, resume_skills)])
+
+    def add_many(self, candidates):
+        """Add or replace (candidate_id, resume_skills) pairs in one transaction"""
+        with self._conn:
+            for candidate_id, resume_skills in candidates:
+                if isinstance(resume_skills, dict):
+                    resume_skills = flatten_skills(resume_skills)
+                skills = list(dict.fromkeys(resume_skills))
+
+                self._delete(candidate_id)
+                row = self._conn.execute(
+                    "INSERT INTO candidates (candidate_id, skills) VALUES (?, ?)",
+                    (candidate_id, json.dumps(skills))
+                ).lastrowid
+                self._conn.executemany(
+                    "INSERT INTO postings (skill, row) VALUES (?, ?)",
+                    [(skill, row) for skill in skills]
+                )
+
+                self._rows[candidate_id] = row
+                if row >= len(self._alive):
+                    grown = np.zeros(max(row + 1, 2 * len(self._alive)), dtype=bool)
+                    grown[:len(self._alive)] = self._alive
+                    self._alive = grown
+                self._alive[row] = True
+                for skill in skills:
+                    self._new_postings.setdefault(skill, []).append(row)
+
+    def remove(self, candidate_id):
+        """Remove a candidate; returns False if it was not indexed"""
+        with self._conn:
+            return self._delete(candidate_id)
+
+    def _delete(self, candidate_id):
+        row = self._rows.pop(candidate_id, None)
+        if row is None:
+            return False
+        self._conn.execute("DELETE FROM postings WHERE row = ?", (row,))
+        self._conn.execute("DELETE FROM candidates WHERE row = ?", (row,))
+        # Stale postings stay in memory and are masked out at query time;
+        # AUTOINCREMENT guarantees the row number is never handed out again
+        self._alive[row] = False
+        return True
+
+    def _posting_array(self, skill):
+        new = self._new_postings.pop(skill, None)
+        postings = self._postings.get(skill)
+        if new:
+            new = np.array(new, dtype=np.int64)
+            postings = new if postings is None else np.concatenate([postings, new])
+            self._postings[skill] = postings
+        return postings
+
+    def top_candidates(self, job_description, k=10):
+        """Top-k candidates by skill-match percentage (JobMatcher's formula)"""
+        job_skills = skill_matcher.find_skills(job_description)
+        if not job_skills or not self._rows:
+            return []
+
+        postings = [p for p in (self._posting_array(skill) for skill in job_skills) if p is not None]
+        if not postings:
+            return []
+        counts = np.bincount(np.concatenate(postings), minlength=len(self._alive))
+        counts[~self._alive] = 0
+
+        k = min(k, int(np.count_nonzero(counts)))
+        if k == 0:
+            return []
+        top = np.argpartition(-counts, k - 1)[:k]
+        top = top[np.lexsort((top, -counts[top]))]
+
+        rows = [int(row) for row in top]
+        placeholders = ",".join("?" * len(rows))
+        found = {
+            row: (candidate_id, json.loads(skills))
+            for row, candidate_id, skills in self._conn.execute(
+                f"SELECT row, candidate_id, skills FROM candidates WHERE row IN ({placeholders})", rows
+            )
+        }
+
+        results = []
+        for row in rows:
+            candidate_id, skills = found[row]
+            skill_set = set(skills)
+            results.append({
+                "candidate_id": candidate_id,
+                "match_percentage": round((int(counts[row]) / len(job_skills)) * 100, 2),
+                "matched_skills": [skill for skill in job_skills if skill in skill_set],
+                "missing_skills": [skill for skill in job_skills if skill not in skill_set]
+            })
+        return results
+
+    def close(self):
+        self._conn.close()
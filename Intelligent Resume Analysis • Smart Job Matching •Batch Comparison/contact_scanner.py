@@ -0,0 +1,42 @@
+import re
+
+# One compiled alternation finds emails, dates and phone numbers in a single
+# left-to-right pass. At each position the branches are tried in order, so a
+# date such as "01/02/2024" is never read as the start of a phone number.
+CONTACT_PATTERN = re.compile(r"""
+    (?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)
+  | (?P<date>
+        \b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{4}      # Jan 2024, January 2024
+        (?:\s*[-–]\s*(?:present|current|ongoing))?\b                               # ... - Present
+      | \b\d{1,2}[-/]\d{1,2}[-/]\d{4}\b                                          # 01/01/2024
+      | \b(?:19|20)\d{2}\s*[-–]\s*(?:present|current|ongoing)\b                  # 2024-Present
+    )
+  | (?<![\w+])(?P<phone>
+        (?:\+?1[\s.-]?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}                        # US format
+      | \+234[\s.-]?\d{3}[\s.-]?\d{3}[\s.-]?\d{4}                                  # Nigeria +234
+      | 0\d{3}[\s.-]?\d{3}[\s.-]?\d{4}                                             # Nigeria 0803 123 4567
+      | \+\d{1,3}(?:[\s.-]?\(?\d{2,4}\)?){2,4}                                     # General international
+    )(?!\d)
+""", re.IGNORECASE | re.VERBOSE)
+
+# spaCy DATE entities are kept only if they mention a month, a year or an open end
+DATE_ENTITY_HINT = re.compile(
+    r"jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|\b(?:20|19)\d{2}\b|\b(?:present|current|ongoing)\b",
+    re.IGNORECASE
+)
+
+
+def scan_contacts(text):
+    """Emails, phone numbers and dates found in one pass, each in text order"""
+    found = {"email": {}, "phone": {}, "date": {}}
+    for match in CONTACT_PATTERN.finditer(text):
+        kind = match.lastgroup
+        value = match.group(kind).strip()
+        if kind == "phone" and not 10 <= sum(char.isdigit() for char in value) <= 15:
+            continue
+        found[kind][value] = None
+    return {
+        "email": list(found["email"]),
+        "phone": list(found["phone"]),
+        "dates": list(found["date"])
+    }
@@ -0,0 +1,131 @@
+import re
+import zlib
+
+import numpy as np
+
+NUM_PERM = 128
+# 16 bands of 8 rows: pairs above ~0.7 Jaccard almost always share a bucket
+LSH_BANDS = 16
+SHINGLE_SIZE = 5
+DUPLICATE_THRESHOLD = 0.8
+
+WORD_PATTERN = re.compile(r'\w+')
+
+
+class NearDuplicateIndex:
+    """Group near-identical texts with MinHash signatures and LSH banding.
+
+    Each text becomes a set of word shingles summarised by a MinHash
+    signature. Signatures are split into bands and every band is a bucket
+    key, so finding candidates costs a few dict lookups per text however many
+    texts are indexed. A candidate counts as a duplicate when the estimated
+    Jaccard similarity of the two signatures reaches `threshold`. Only group
+    representatives are in the LSH buckets; later members attach to the first
+    one seen, and are regrouped if that representative is removed.
+    """
+
+    def __init__(self, threshold=DUPLICATE_THRESHOLD, num_perm=NUM_PERM, bands=LSH_BANDS,
+                 shingle_size=SHINGLE_SIZE, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        # Multiply-shift hash family over 64-bit words: (a * x + b) >> 32, a odd
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+        self._buckets = [{} for _ in range(bands)]
+        self._signatures = {}
+        self._representatives = {}
+        self.groups = {}
+
+    def _shingles(self, text):
+        words = WORD_PATTERN.findall(text.lower())
+        if not words:
+            return np.zeros(0, dtype=np.uint64)
+        size = min(self.shingle_size, len(words))
+        shingles = {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+        return np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+
+    def signature(self, text):
+        """MinHash signature of text's word shingles, or None if it has no words"""
+        shingles = self._shingles(text)
+        if not len(shingles):
+            return None
+        hashes = (shingles[:, None] * self._a + self._b) >> np.uint64(32)
+        return hashes.min(axis=0)
+
+    def _band_keys(self, signature):
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def add(self, key, text):
+        """Index text under key; returns the key of its group's representative
+
+        That is key itself for a new text, or the representative of the
+        near-duplicate group it joined.
+        """
+        return self._insert(key, self.signature(text))
+
+    def _insert(self, key, signature):
+        self._signatures[key] = signature
+        if signature is None:
+            self._representatives[key] = key
+            self.groups[key] = []
+            return key
+
+        band_keys = self._band_keys(signature)
+        candidates = {}
+        for buckets, band_key in zip(self._buckets, band_keys):
+            for candidate in buckets.get(band_key, ()):
+                candidates[candidate] = None
+
+        best, best_similarity = None, self.threshold
+        for candidate in candidates:
+            similarity = float(np.mean(self._signatures[candidate] == signature))
+            if similarity >= best_similarity:
+                best, best_similarity = candidate, similarity
+        if best is not None:
+            self._representatives[key] = best
+            self.groups[best].append(key)
+            return best
+
+        self._representatives[key] = key
+        self.groups[key] = []
+        for buckets, band_key in zip(self._buckets, band_keys):
+            buckets.setdefault(band_key, []).append(key)
+        return key
+
+    def remove(self, key):
+        """Forget key; members of a removed representative are regrouped"""
+        representative = self._representatives.pop(key, None)
+        if representative is None:
+            return False
+        signature = self._signatures.pop(key)
+        if representative != key:
+            self.groups[representative].remove(key)
+            return True
+
+        members = self.groups.pop(key)
+        if signature is not None:
+            for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+                buckets[band_key].remove(key)
+                if not buckets[band_key]:
+                    del buckets[band_key]
+        for member in members:
+            del self._representatives[member]
+            self._insert(member, self._signatures.pop(member))
+        return True
+
+    def keys(self):
+        """Every indexed key, representatives and duplicates alike"""
+        return list(self._representatives)
+
+    def representative(self, key):
+        """Representative of key's group (key itself if it leads one), or None"""
+        return self._representatives.get(key)
+
+    def duplicates(self, key):
+        """Keys collapsed into the representative key, in the order added"""
+        return list(self.groups.get(key, []))
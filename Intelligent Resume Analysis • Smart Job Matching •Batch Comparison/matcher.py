@@ -1,6 +1,70 @@
+from collections import Counter
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from scipy import sparse
 import numpy as np
+from skill_matcher import skill_matcher
+
+# A TfidfVectorizer fitted on two documents (smooth_idf) weights terms found in
+# both with idf 1 and terms found in only one with 1 + ln(3/2). Knowing that,
+# JobMatcher.semantic_similarity can be reproduced without refitting per pair.
+PAIR_IDF_SQ = (1 + np.log(1.5)) ** 2
+
+
+def flatten_skills(skills_dict):
+    """Convert skill dict to flat list"""
+    return [skill for category in skills_dict.values() for skill in category]
+
+
+def _skill_documents(resume_skills_list):
+    """The text semantic_similarity compares for each resume"""
+    return [" ".join(flatten_skills(resume_skills)) for resume_skills in resume_skills_list]
+
+
+def _binary_matrix(item_lists, vocabulary):
+    """Sparse rows x vocabulary matrix with a 1 for each (unique) item present"""
+    rows, cols = [], []
+    for i, items in enumerate(item_lists):
+        for item in items:
+            col = vocabulary.get(item)
+            if col is not None:
+                rows.append(i)
+                cols.append(col)
+    return sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(len(item_lists), len(vocabulary))
+    )
+
+
+def _count_terms(analyzer, documents, vocabulary):
+    """Sparse counts of vocabulary terms per document, plus each document's
+    sum of squared counts over all of its terms"""
+    rows, cols, values = [], [], []
+    total_sq = np.zeros(len(documents))
+    for i, document in enumerate(documents):
+        for term, count in Counter(analyzer(document)).items():
+            total_sq[i] += count * count
+            col = vocabulary.get(term)
+            if col is not None:
+                rows.append(i)
+                cols.append(col)
+                values.append(count)
+    matrix = sparse.csr_matrix(
+        (values, (rows, cols)), shape=(len(documents), len(vocabulary)), dtype=float
+    )
+    return matrix, total_sq
+
+
+def _pair_cosine(dot, resume_shared_sq, job_shared_sq, resume_total_sq, job_total_sq):
+    """Two-document TF-IDF cosine from raw count products.
+
+    Shared terms have idf 1, so they contribute plainly to the dot product;
+    only each side's norm needs the single-document idf for its other terms.
+    """
+    resume_norm_sq = PAIR_IDF_SQ * resume_total_sq - (PAIR_IDF_SQ - 1) * resume_shared_sq
+    job_norm_sq = PAIR_IDF_SQ * job_total_sq - (PAIR_IDF_SQ - 1) * job_shared_sq
+    norms = np.sqrt(resume_norm_sq * job_norm_sq)
+    similarity = np.divide(dot, norms, out=np.zeros_like(dot), where=norms > 0)
+    return np.round(similarity * 100, 2)
 
 
 class JobMatcher:
@@ -10,7 +74,7 @@ class JobMatcher:
     
     def flatten_skills(self, skills_dict):
         """Convert skill dict to flat list"""
-        return [skill for category in skills_dict.values() for skill in category]
+        return flatten_skills(skills_dict)
     
     def calculate_skill_match(self):
         """Calculate matching skills percentage"""
@@ -36,18 +100,8 @@ class JobMatcher:
     
     def extract_job_skills(self, job_description):
         """Extract skills mentioned in job description"""
-        job_skills = []
-        job_text_lower = job_description.lower()
-        
-        # Get all skills from the database
-        from skills_database import SKILLS_DB
-        
-        for category, skills in SKILLS_DB.items():
-            for skill in skills:
-                if skill.lower() in job_text_lower:
-                    job_skills.append(skill)
-        
-        return job_skills
+        # Same matcher and word-boundary rules as ResumeProcessor.extract_skills
+        return skill_matcher.find_skills(job_description)
     
     def semantic_similarity(self):
         """Calculate semantic similarity using TF-IDF"""
@@ -72,4 +126,166 @@ class JobMatcher:
             "skill_match": skill_match,
             "semantic_similarity": semantic_score,
             "overall_score": round((skill_match["match_percentage"] + semantic_score) / 2, 2)
-        }
\ No newline at end of file
+        }
+
+
+class BatchJobMatcher:
+    """Score many resumes against one job description.
+
+    The job's skill set and term counts are prepared once; each call then
+    scores a list of resumes with a few sparse matrix products. Reports have
+    the same fields and values as JobMatcher.get_match_report.
+    """
+
+    def __init__(self, job_description):
+        self.job_description = job_description
+        self.job_skills = skill_matcher.find_skills(job_description)
+        self._job_skill_set = set(self.job_skills)
+
+        self._analyzer = TfidfVectorizer(stop_words='english').build_analyzer()
+        job_counts = Counter(self._analyzer(job_description))
+        self._vocabulary = {term: i for i, term in enumerate(job_counts)}
+        self._job_counts = np.array(list(job_counts.values()), dtype=float)
+
+    def calculate_skill_match(self, resume_skills):
+        """Same result as JobMatcher.calculate_skill_match"""
+        if not self.job_skills:
+            return {
+                "match_percentage": 0,
+                "matched_skills": [],
+                "missing_skills": []
+            }
+
+        resume_skills_flat = set(flatten_skills(resume_skills))
+        matched = resume_skills_flat & self._job_skill_set
+        return {
+            "match_percentage": round((len(matched) / len(self.job_skills)) * 100, 2),
+            "matched_skills": list(matched),
+            "missing_skills": list(self._job_skill_set - resume_skills_flat)
+        }
+
+    def semantic_similarities(self, resume_skills_list):
+        """JobMatcher.semantic_similarity for every resume, as an array"""
+        if not resume_skills_list:
+            return np.zeros(0)
+        counts, total_sq = _count_terms(self._analyzer, _skill_documents(resume_skills_list), self._vocabulary)
+        job = self._job_counts
+        return _pair_cosine(
+            dot=counts @ job,
+            resume_shared_sq=counts.multiply(counts).sum(axis=1).A1,
+            job_shared_sq=(counts > 0).astype(float) @ (job * job),
+            resume_total_sq=total_sq,
+            job_total_sq=job @ job
+        )
+
+    def get_match_reports(self, resume_skills_list):
+        """One get_match_report-style dict per resume, in input order"""
+        semantic_scores = self.semantic_similarities(resume_skills_list)
+        reports = []
+        for resume_skills, semantic_score in zip(resume_skills_list, semantic_scores):
+            skill_match = self.calculate_skill_match(resume_skills)
+            semantic_score = float(semantic_score)
+            reports.append({
+                "skill_match": skill_match,
+                "semantic_similarity": semantic_score,
+                # np.round, like JobMatcher's numpy-typed score, for identical ties
+                "overall_score": float(np.round((skill_match["match_percentage"] + semantic_score) / 2, 2))
+            })
+        return reports
+
+    def get_match_report(self, resume_skills):
+        """Report for a single resume"""
+        return self.get_match_reports([resume_skills])[0]
+
+
+
+class MultiJobMatcher:
+    """Score N resumes against M job descriptions as N x M matrices.
+
+    Every job's skills and term counts are prepared once. Scoring builds one
+    sparse matrix for the resumes and combines them with a handful of sparse
+    products, so no per-pair JobMatcher is created. Each cell equals the
+    corresponding JobMatcher.get_match_report value.
+    """
+
+    def __init__(self, job_descriptions):
+        """job_descriptions is a list of texts or a dict of name -> text"""
+        if not isinstance(job_descriptions, dict):
+            job_descriptions = {i: text for i, text in enumerate(job_descriptions)}
+        self.job_names = list(job_descriptions)
+        texts = list(job_descriptions.values())
+
+        # Job skills as a binary jobs x skills matrix
+        self.job_skills = [skill_matcher.find_skills(text) for text in texts]
+        self._skill_vocabulary = {}
+        for skills in self.job_skills:
+            for skill in skills:
+                self._skill_vocabulary.setdefault(skill, len(self._skill_vocabulary))
+        self._job_skill_matrix = _binary_matrix(self.job_skills, self._skill_vocabulary)
+        self._job_skill_counts = np.array([len(skills) for skills in self.job_skills], dtype=float)
+
+        # Job term counts over the union of job vocabularies
+        self._analyzer = TfidfVectorizer(stop_words='english').build_analyzer()
+        self._vocabulary = {}
+        for text in texts:
+            for term in self._analyzer(text):
+                self._vocabulary.setdefault(term, len(self._vocabulary))
+        self._job_counts, self._job_total_sq = _count_terms(self._analyzer, texts, self._vocabulary)
+        self._job_present = (self._job_counts > 0).astype(float)
+        self._job_counts_sq = self._job_counts.multiply(self._job_counts)
+
+    def score_matrix(self, resume_skills_list):
+        """Dict of N x M arrays: skill_match, semantic_similarity, overall_score"""
+        n_jobs = len(self.job_names)
+        if not resume_skills_list:
+            empty = np.zeros((0, n_jobs))
+            return {"skill_match": empty, "semantic_similarity": empty, "overall_score": empty}
+
+        # Skill match: matched skills per pair over the job's skill count
+        resume_skills = [set(flatten_skills(skills)) for skills in resume_skills_list]
+        resume_skill_matrix = _binary_matrix(resume_skills, self._skill_vocabulary)
+        matches = (resume_skill_matrix @ self._job_skill_matrix.T).toarray()
+        skill_match = np.divide(
+            matches * 100, self._job_skill_counts,
+            out=np.zeros_like(matches), where=self._job_skill_counts > 0
+        )
+        skill_match = np.round(skill_match, 2)
+
+        # Semantic similarity: the two-document TF-IDF cosine for every pair
+        counts, total_sq = _count_terms(self._analyzer, _skill_documents(resume_skills_list), self._vocabulary)
+        semantic = _pair_cosine(
+            dot=(counts @ self._job_counts.T).toarray(),
+            resume_shared_sq=(counts.multiply(counts) @ self._job_present.T).toarray(),
+            job_shared_sq=((counts > 0).astype(float) @ self._job_counts_sq.T).toarray(),
+            resume_total_sq=total_sq[:, None],
+            job_total_sq=self._job_total_sq[None, :]
+        )
+
+        return {
+            "skill_match": skill_match,
+            "semantic_similarity": semantic,
+            "overall_score": np.round((skill_match + semantic) / 2, 2)
+        }
+
+    def top_candidates(self, scores, k=10, by="overall_score", resume_names=None):
+        """Top-k resumes per job from score_matrix output, best first"""
+        matrix = scores[by]
+        k = min(k, matrix.shape[0])
+        ranking = {}
+        for j, job_name in enumerate(self.job_names):
+            if k == 0:
+                ranking[job_name] = []
+                continue
+            column = matrix[:, j]
+            top = np.argpartition(-column, k - 1)[:k]
+            top = top[np.lexsort((top, -column[top]))]
+            ranking[job_name] = [
+                {
+                    "resume": resume_names[i] if resume_names is not None else int(i),
+                    "skill_match": float(scores["skill_match"][i, j]),
+                    "semantic_similarity": float(scores["semantic_similarity"][i, j]),
+                    "overall_score": float(scores["overall_score"][i, j])
+                }
+                for i in top
+            ]
+        return ranking
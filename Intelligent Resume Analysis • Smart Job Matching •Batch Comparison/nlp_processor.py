@@ -1,32 +1,53 @@
 import spacy
 from skills_database import SKILLS_DB, EDUCATION_DB, EXPERIENCE_KEYWORDS
-import re
+from skill_matcher import skill_matcher
+from profiling import NULL_PROFILER
+from contact_scanner import scan_contacts, DATE_ENTITY_HINT
 
-nlp = spacy.load("en_core_web_sm")
+MODEL_NAME = "en_core_web_sm"
+# The extractors only read tokens, entities (NER) and sentence boundaries, so
+# tagging, lemmatizing and the dependency parser are never loaded; the small
+# "senter" component provides doc.sents instead of the parser
+EXCLUDED_COMPONENTS = ["tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+_nlp = None
+
+def get_nlp():
+    """Load the trimmed spaCy pipeline on first use"""
+    global _nlp
+    if _nlp is None:
+        nlp = spacy.load(MODEL_NAME, exclude=EXCLUDED_COMPONENTS)
+        # With its listeners excluded the shared tok2vec would run for nothing
+        if "tok2vec" in nlp.pipe_names and not nlp.get_pipe("tok2vec").listening_components:
+            nlp.remove_pipe("tok2vec")
+        if "senter" in nlp.disabled:
+            nlp.enable_pipe("senter")
+        elif not nlp.has_pipe("senter") and not nlp.has_pipe("sentencizer"):
+            nlp.add_pipe("sentencizer")
+        _nlp = nlp
+    return _nlp
 
 class ResumeProcessor:
-    def __init__(self):
+    def __init__(self, profiler=None):
         self.skills_db = SKILLS_DB
         self.education_db = EDUCATION_DB
+        self.skill_matcher = skill_matcher
+        # Optional profiling.StageProfiler; records one timing per stage per resume
+        self.profiler = profiler or NULL_PROFILER
     
     def extract_skills(self, text):
         """Extract skills from resume text"""
-        text_lower = text.lower()
-        found_skills = {}
-        
-        for category, skills in self.skills_db.items():
-            found_skills[category] = []
-            for skill in skills:
-                # Case-insensitive search with word boundaries
-                pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-                if re.search(pattern, text_lower):
-                    found_skills[category].append(skill)
-        
-        return found_skills
+        # Single pass over the text with the shared, precompiled matcher
+        return self.skill_matcher.match_by_category(text)
     
-    def extract_education(self, text):
+    def parse(self, text):
+        """Run the spaCy pipeline once so every extractor can share the Doc"""
+        return get_nlp()(text)
+    
+    def extract_education(self, text, doc=None):
         """Extract education information"""
-        doc = nlp(text)
+        if doc is None:
+            doc = self.parse(text)
         education = []
         
         # Look for education keywords using spaCy
@@ -39,74 +60,42 @@ class ResumeProcessor:
         
         return list(set(education))  # Remove duplicates
     
-    def extract_email(self, text):
+    def extract_email(self, text, contacts=None):
         """Extract email addresses from resume"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return list(set(emails))  # Remove duplicates
+        if contacts is None:
+            contacts = scan_contacts(text)
+        return contacts["email"]
     
-    def extract_phone(self, text):
+    def extract_phone(self, text, contacts=None):
         """Extract phone numbers from resume"""
-        # Patterns for different phone formats
-        phone_patterns = [
-            r'\+?1?\s*\(?([0-9]{3})\)?[\s.-]?([0-9]{3})[\s.-]?([0-9]{4})',  # US format
-            r'\+234\s?([0-9]{10})',  # Nigeria +234
-            r'0\d{10}',  # Nigeria format 0XXXXXXXXXX
-            r'\+?[\d\s\-\(\)]{10,15}'  # General international format
-        ]
-        
-        phones = []
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            phones.extend(matches)
-        
-        # Filter out numbers that are too short or obviously not phones
-        cleaned_phones = []
-        for phone in phones:
-            if isinstance(phone, tuple):
-                phone = ''.join(str(p) for p in phone if p)
-            phone_str = str(phone)
-            # Keep only if it has at least 10 digits
-            digits_only = re.sub(r'\D', '', phone_str)
-            if len(digits_only) >= 10:
-                cleaned_phones.append(phone_str)
-        
-        return list(set(cleaned_phones))  # Remove duplicates
+        if contacts is None:
+            contacts = scan_contacts(text)
+        return contacts["phone"]
     
-    def extract_dates(self, text):
+    def extract_dates(self, text, doc=None, contacts=None):
         """Extract valid dates/periods from resume"""
-        doc = nlp(text)
-        dates = []
+        if doc is None:
+            doc = self.parse(text)
+        if contacts is None:
+            contacts = scan_contacts(text)
+        dates = {}
         
-        # Look for DATE entities from spaCy
+        # Look for DATE entities from spaCy that look like real dates
+        # (contain month names, year patterns or "present")
         for ent in doc.ents:
             if ent.label_ == "DATE":
-                # Filter out random numbers that spaCy might have flagged
                 date_text = ent.text.strip()
-                # Check if it looks like a real date (contains month names or year patterns)
-                if any(month in date_text.lower() for month in 
-                       ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']) \
-                   or re.search(r'\b(20|19)\d{2}\b', date_text) \
-                   or re.search(r'\b(present|current|ongoing)\b', date_text, re.IGNORECASE):
-                    dates.append(date_text)
-        
-        # Also look for common date patterns
-        date_patterns = [
-            r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}\b',  # Jan 2024
-            r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b',
-            r'\b\d{1,2}[-/]\d{1,2}[-/]\d{4}\b',  # 01/01/2024
-            r'\b(20|19)\d{2}[-–]\s*(present|current|ongoing)\b',  # 2024-Present
-        ]
+                if DATE_ENTITY_HINT.search(date_text):
+                    dates[date_text] = None
         
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            dates.extend(matches)
-        
-        return list(set(dates))  # Remove duplicates
+        # Plus the date patterns found by the contact scanner
+        dates.update(dict.fromkeys(contacts["dates"]))
+        return list(dates)
     
-    def extract_experience(self, text):
+    def extract_experience(self, text, doc=None):
         """Extract work experience highlights"""
-        doc = nlp(text)
+        if doc is None:
+            doc = self.parse(text)
         experiences = []
         
         for sent in doc.sents:
@@ -119,9 +108,10 @@ class ResumeProcessor:
         
         return experiences[:10]  # Return top 10 experiences
     
-    def extract_entities(self, text):
+    def extract_entities(self, text, doc=None):
         """Extract named entities (organizations only, not dates)"""
-        doc = nlp(text)
+        if doc is None:
+            doc = self.parse(text)
         entities = {
             "ORG": [],
             "PERSON": []
@@ -138,13 +128,57 @@ class ResumeProcessor:
         return entities
     
     def process_resume(self, text):
-        """Complete resume processing pipeline"""
+        """Complete resume processing pipeline
+        
+        text may also be an iterable of page texts, e.g. the stream from
+        text_extractor.iter_pdf_pages.
+        """
+        if not isinstance(text, str):
+            text = "\n".join(text)
+        # Parse once and hand the same Doc to every spaCy-based extractor
+        with self.profiler.stage("spacy_parse"):
+            doc = self.parse(text)
+        return self._build_results(text, doc)
+    
+    def process_batch(self, items, n_process=1, batch_size=16):
+        """Process (text, context) pairs with nlp.pipe, yielding (context, results)
+        
+        Docs are parsed in batches (and across n_process workers when > 1);
+        results come back in input order as soon as each batch is done.
+        """
+        docs = iter(get_nlp().pipe(items, as_tuples=True, n_process=n_process, batch_size=batch_size))
+        while True:
+            # Time spent waiting on the pipe, including any upstream extraction
+            with self.profiler.stage("spacy_pipe"):
+                item = next(docs, None)
+            if item is None:
+                return
+            doc, context = item
+            yield context, self._build_results(doc.text, doc)
+    
+    def _build_results(self, text, doc):
+        stage = self.profiler.stage
+        with stage("extract_skills"):
+            skills = self.extract_skills(text)
+        with stage("extract_education"):
+            education = self.extract_education(text, doc)
+        with stage("extract_experience"):
+            experience = self.extract_experience(text, doc)
+        with stage("extract_entities"):
+            entities = self.extract_entities(text, doc)
+        # Emails, phones and date patterns come from one regex pass
+        with stage("scan_contacts"):
+            contacts = scan_contacts(text)
+        email = self.extract_email(text, contacts)
+        phone = self.extract_phone(text, contacts)
+        with stage("extract_dates"):
+            dates = self.extract_dates(text, doc, contacts)
         return {
-            "skills": self.extract_skills(text),
-            "education": self.extract_education(text),
-            "experience": self.extract_experience(text),
-            "entities": self.extract_entities(text),
-            "email": self.extract_email(text),
-            "phone": self.extract_phone(text),
-            "dates": self.extract_dates(text)
+            "skills": skills,
+            "education": education,
+            "experience": experience,
+            "entities": entities,
+            "email": email,
+            "phone": phone,
+            "dates": dates
         }
\ No newline at end of file
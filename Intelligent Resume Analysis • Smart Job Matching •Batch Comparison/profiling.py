@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+
+
+class StageProfiler:
+    """Wall-clock timings per named pipeline stage.
+
+    Keeps a running count and total for every stage plus the most recent
+    `max_samples` durations, from which p50/p95 are reported.
+    """
+
+    def __init__(self, max_samples=1000):
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._samples = {}
+            self._counts = {}
+            self._totals = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        with self._lock:
+            if name not in self._samples:
+                self._samples[name] = deque(maxlen=self.max_samples)
+                self._counts[name] = 0
+                self._totals[name] = 0.0
+            self._samples[name].append(seconds)
+            self._counts[name] += 1
+            self._totals[name] += seconds
+
+    def summary(self):
+        """One dict per stage, in first-seen order"""
+        with self._lock:
+            stages = [(name, list(samples)) for name, samples in self._samples.items()]
+            counts, totals = dict(self._counts), dict(self._totals)
+
+        rows = []
+        for name, samples in stages:
+            p50, p95 = np.percentile(samples, [50, 95]) * 1000
+            rows.append({
+                "stage": name,
+                "count": counts[name],
+                "total_ms": round(totals[name] * 1000, 2),
+                "p50_ms": round(float(p50), 3),
+                "p95_ms": round(float(p95), 3),
+                "docs_per_sec": round(counts[name] / totals[name], 1) if totals[name] else None
+            })
+        return rows
+
+
+class _NullProfiler:
+    """Stand-in when profiling is off; stages cost a no-op context manager"""
+
+    def stage(self, name):
+        return nullcontext()
+
+    def record(self, name, seconds):
+        pass
+
+
+NULL_PROFILER = _NullProfiler()
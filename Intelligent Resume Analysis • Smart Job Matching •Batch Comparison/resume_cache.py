@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from importlib import metadata
+
+# Modules whose code decides what a cached parse contains
+PIPELINE_MODULES = ("text_extractor.py", "nlp_processor.py", "contact_scanner.py",
+                    "skill_matcher.py", "skills_database.py", "taxonomy.py")
+PIPELINE_PACKAGES = ("spacy", "en_core_web_sm", "pdfplumber")
+
+
+@lru_cache(maxsize=1)
+def pipeline_version():
+    """SHA-256 of the parsing code, its package versions and the SKILLS_TAXONOMY file
+
+    Part of every content_key, so entries parsed by older code or another
+    taxonomy (including ones on disk from earlier runs) are never served.
+    """
+    digest = hashlib.sha256()
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in PIPELINE_MODULES:
+        with open(os.path.join(base_dir, name), "rb") as f:
+            digest.update(f.read())
+    for package in PIPELINE_PACKAGES:
+        try:
+            digest.update(f"{package}=={metadata.version(package)}".encode())
+        except metadata.PackageNotFoundError:
+            digest.update(f"{package} missing".encode())
+    taxonomy = os.environ.get("SKILLS_TAXONOMY")
+    if taxonomy:
+        with open(taxonomy, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def content_key(data):
+    """Cache key for an uploaded file: SHA-256 of the pipeline version and its raw bytes"""
+    digest = hashlib.sha256(pipeline_version().encode())
+    digest.update(data)
+    return digest.hexdigest()
+
+
+class ResumeCache:
+    """Two-tier cache of parsed resumes keyed by file content hash.
+
+    The memory tier is an LRU of the most recent entries. The optional disk
+    tier stores one JSON file per entry under `disk_dir` and evicts the least
+    recently used files once the directory grows past `max_disk_bytes`.
+    """
+
+    def __init__(self, max_entries=256, disk_dir=None, max_disk_bytes=100 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def get(self, key):
+        """Cached value for key, or None"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+        value = self._read_disk(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        """Store a JSON-serializable value in both tiers"""
+        with self._lock:
+            self._remember(key, value)
+        if self.disk_dir:
+            self._write_disk(key, value)
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, computing and storing it on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+            os.utime(path)  # mark as recently used for eviction
+            return value
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key, value):
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing resume cache: {e}")
+            return
+        self._evict_disk()
+
+    def _evict_disk(self):
+        entries = []
+        for name in os.listdir(self.disk_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.disk_dir, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.disk_dir, name))
+                total -= size
+            except OSError:
+                pass
+
+    def stats(self):
+        """Hit/miss counters for display"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            "entries": len(self._memory)
+        }
@@ -0,0 +1,204 @@
+"""Headless bulk resume screening.
+
+Scores every PDF/TXT resume under a directory against one or more job
+descriptions and writes one row per (resume, job) pair in chunked JSONL or
+Parquet part files. Completed chunks are recorded in a checkpoint manifest,
+so an interrupted run picks up where it stopped when started again. The
+manifest tracks resumes, not jobs: use a fresh output directory to screen
+the same resumes against a different set of jobs. Resumes that cannot be
+read, or have no text, get one row with the error column set and are listed
+as failed in the manifest, so the next run tries them again.
+
+    python screen_resumes.py resumes/ --job jobs/data_scientist.txt \\
+        --job jobs/devops.txt --output screening/ --format parquet --workers 8
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+import pandas as pd
+
+from matcher import BatchJobMatcher, flatten_skills
+from nlp_processor import ResumeProcessor
+from text_extractor import extract_text_from_pdf, clean_text, MAX_TEXT_CHARS
+
+RESUME_EXTENSIONS = (".pdf", ".txt")
+MANIFEST_NAME = "manifest.jsonl"
+
+# Per-worker state, built once by _init_worker
+_processor = None
+_matchers = None
+
+
+def find_resumes(directory):
+    """All PDF/TXT files under directory, relative and sorted for stable chunks"""
+    paths = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.lower().endswith(RESUME_EXTENSIONS):
+                paths.append(os.path.relpath(os.path.join(root, name), directory))
+    return sorted(paths)
+
+
+def read_manifest(path):
+    """Files already screened by earlier runs, and the next free chunk number
+
+    Files listed under "failed" are not counted as done.
+    """
+    done, next_chunk = set(), 0
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn last line from an interrupted write
+                done.update(entry["files"])
+                next_chunk = max(next_chunk, entry["chunk"] + 1)
+    return done, next_chunk
+
+
+def _init_worker(jobs):
+    global _processor, _matchers
+    _processor = ResumeProcessor()
+    _matchers = {name: BatchJobMatcher(text) for name, text in jobs.items()}
+
+
+def _read_text(path):
+    if path.lower().endswith(".pdf"):
+        return extract_text_from_pdf(path, strict=True)
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return f.read(MAX_TEXT_CHARS)
+
+
+def _screen_batch(task):
+    """Worker: extract, parse and score a batch of resumes
+
+    Returns the screened paths, the paths that failed and the rows for both.
+    """
+    directory, paths = task
+    texts, rows, failed = [], [], []
+    for path in paths:
+        try:
+            text = clean_text(_read_text(os.path.join(directory, path)))
+            if not text:
+                raise ValueError("no extractable text")
+            texts.append((text, path))
+        except Exception as e:
+            failed.append(path)
+            rows.append({"resume": path, "error": str(e)})
+
+    parsed_list = list(_processor.process_batch(texts))
+    reports = {
+        name: matcher.get_match_reports([parsed["skills"] for _, parsed in parsed_list])
+        for name, matcher in _matchers.items()
+    }
+    for i, (path, parsed) in enumerate(parsed_list):
+        for job_name, job_reports in reports.items():
+            report = job_reports[i]
+            rows.append({
+                "resume": path,
+                "job": job_name,
+                "skill_match": report["skill_match"]["match_percentage"],
+                "semantic_similarity": report["semantic_similarity"],
+                "overall_score": report["overall_score"],
+                "matched_skills": report["skill_match"]["matched_skills"],
+                "missing_skills": report["skill_match"]["missing_skills"],
+                "skills": flatten_skills(parsed["skills"]),
+                "email": parsed["email"][0] if parsed["email"] else None,
+                "phone": parsed["phone"][0] if parsed["phone"] else None,
+                "error": None
+            })
+    return [path for _, path in texts], failed, rows
+
+
+def write_chunk(rows, output_dir, chunk, fmt):
+    """Write one part file atomically and return its name"""
+    name = f"part-{chunk:05d}.{fmt}"
+    path = os.path.join(output_dir, name)
+    tmp_path = path + ".tmp"
+    df = pd.DataFrame(rows)
+    if fmt == "parquet":
+        df.to_parquet(tmp_path, index=False)
+    else:
+        df.to_json(tmp_path, orient="records", lines=True)
+    os.replace(tmp_path, path)
+    return name
+
+
+def screen(resume_dir, jobs, output_dir, fmt="jsonl", workers=None, chunk_size=1000, batch_size=32):
+    """Screen all resumes in resume_dir, resuming from the manifest if present"""
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    done, chunk = read_manifest(manifest_path)
+
+    pending = [path for path in find_resumes(resume_dir) if path not in done]
+    print(f"{len(done)} resumes already screened, {len(pending)} to go "
+          f"against {len(jobs)} job(s)")
+    if not pending:
+        return
+
+    tasks = [(resume_dir, pending[i:i + batch_size]) for i in range(0, len(pending), batch_size)]
+    start = time.perf_counter()
+    processed = failures = 0
+    chunk_files, chunk_failed, chunk_rows = [], [], []
+
+    def flush():
+        nonlocal chunk
+        name = write_chunk(chunk_rows, output_dir, chunk, fmt)
+        # The manifest line is the commit point: a chunk not listed is redone
+        with open(manifest_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"chunk": chunk, "output": name, "files": chunk_files,
+                                "failed": chunk_failed}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        chunk += 1
+        chunk_files.clear()
+        chunk_failed.clear()
+        chunk_rows.clear()
+
+    with Pool(workers, initializer=_init_worker, initargs=(jobs,)) as pool:
+        for paths, failed, rows in pool.imap_unordered(_screen_batch, tasks):
+            chunk_files.extend(paths)
+            chunk_failed.extend(failed)
+            chunk_rows.extend(rows)
+            processed += len(paths) + len(failed)
+            failures += len(failed)
+            if len(chunk_files) + len(chunk_failed) >= chunk_size:
+                flush()
+            elapsed = time.perf_counter() - start
+            print(f"\r{processed}/{len(pending)} resumes, {processed / elapsed:.1f} docs/sec",
+                  end="", file=sys.stderr, flush=True)
+        if chunk_files or chunk_failed:
+            flush()
+
+    elapsed = time.perf_counter() - start
+    print(f"\nScreened {processed} resumes in {elapsed:.1f}s ({processed / elapsed:.1f} docs/sec), "
+          f"{failures} failed", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk resume screening against job descriptions")
+    parser.add_argument("resume_dir", help="directory searched recursively for PDF/TXT resumes")
+    parser.add_argument("--job", action="append", required=True,
+                        help="job description text file (repeat for several jobs)")
+    parser.add_argument("--output", required=True, help="directory for part files and the manifest")
+    parser.add_argument("--format", choices=["jsonl", "parquet"], default="jsonl")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=1000, help="resumes per output part file")
+    parser.add_argument("--batch-size", type=int, default=32, help="resumes per worker task")
+    args = parser.parse_args()
+
+    jobs = {}
+    for path in args.job:
+        with open(path, "r", encoding="utf-8") as f:
+            jobs[os.path.splitext(os.path.basename(path))[0]] = f.read()
+
+    screen(args.resume_dir, jobs, args.output, args.format, args.workers, args.chunk_size, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
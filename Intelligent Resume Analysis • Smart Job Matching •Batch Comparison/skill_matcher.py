@@ -0,0 +1,105 @@
+import os
+import re
+from skills_database import SKILLS_DB
+
+# Word runs and single punctuation characters, the same units the matcher walks
+TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+class SkillMatcher:
+    """Find every taxonomy skill in a text with one left-to-right pass.
+
+    All terms are compiled into a single lookup table keyed by the lowercased
+    phrase and every token prefix of it, so scanning walks each token of the
+    text once and only extends while the phrase can still grow into a skill.
+    The cost depends on the text length, not on the number of skills.
+
+    A skill matches when it is not glued to a word character on either side,
+    i.e. ``(?<!\\w)skill(?!\\w)``. This is the ``\\b`` rule for ordinary
+    skills and also lets skills that end in punctuation ("C++", "C#") match.
+    """
+
+    def __init__(self, skills_db=None, aliases=None):
+        """skills_db maps category -> skills; aliases maps alias -> skill"""
+        skills_db = SKILLS_DB if skills_db is None else skills_db
+        self.categories = list(skills_db)
+        self._order = {}
+        self._table = {}
+
+        canonical = {}
+        for category, skills in skills_db.items():
+            for skill in skills:
+                entry = (category, skill)
+                self._order.setdefault(entry, len(self._order))
+                canonical.setdefault(skill.lower(), []).append(entry)
+                self._add_term(skill, entry)
+
+        for alias, skill in (aliases or {}).items():
+            for entry in canonical.get(skill.lower(), []):
+                self._add_term(alias, entry)
+
+    def _add_term(self, term, entry):
+        term = term.strip().lower()
+        if not term:
+            return
+        # Register every token prefix so the scan knows when to keep extending
+        for token in TOKEN_PATTERN.finditer(term):
+            self._table.setdefault(term[:token.end()], ())
+        if entry not in self._table[term]:
+            self._table[term] = self._table[term] + (entry,)
+
+    def __len__(self):
+        return len(self._order)
+
+    def scan(self, text):
+        """Yield (category, skill) for every occurrence in text order"""
+        text = text.lower()
+        length = len(text)
+        table = self._table
+        tokens = [(m.start(), m.end()) for m in TOKEN_PATTERN.finditer(text)]
+
+        for i in range(len(tokens)):
+            start = tokens[i][0]
+            if start > 0 and _is_word_char(text[start - 1]):
+                continue
+            for j in range(i, len(tokens)):
+                end = tokens[j][1]
+                entries = table.get(text[start:end])
+                if entries is None:
+                    break
+                if entries and (end == length or not _is_word_char(text[end])):
+                    yield from entries
+
+    def find(self, text):
+        """Unique (category, skill) pairs found in text, in taxonomy order"""
+        return sorted(set(self.scan(text)), key=self._order.__getitem__)
+
+    def find_skills(self, text):
+        """Flat list of unique skill names found in text, in taxonomy order"""
+        return list(dict.fromkeys(skill for _, skill in self.find(text)))
+
+    def match_by_category(self, text):
+        """Skills found in text grouped by category, every category present"""
+        found = {category: [] for category in self.categories}
+        for category, skill in self.find(text):
+            found[category].append(skill)
+        return found
+
+
+# Optional external taxonomy (CSV/JSON, see taxonomy.py) used instead of SKILLS_DB
+SKILLS_TAXONOMY = os.environ.get("SKILLS_TAXONOMY")
+
+
+def _default_matcher():
+    if SKILLS_TAXONOMY:
+        from taxonomy import load_matcher
+        return load_matcher(SKILLS_TAXONOMY)
+    return SkillMatcher(SKILLS_DB)
+
+
+# Compiled once at import and shared by ResumeProcessor and JobMatcher
+skill_matcher = _default_matcher()
@@ -0,0 +1,112 @@
+"""External skills taxonomies and their precompiled matcher artifacts.
+
+A taxonomy is a CSV with `category,skill,aliases` columns (aliases separated
+by "|", e.g. `Cloud & DevOps,Kubernetes,k8s|kube`) or a JSON object mapping
+each category to a list of skill names or `{"skill": ..., "aliases": [...]}`
+objects. Aliases are matched in text and reported as their canonical skill.
+
+Compiling a SkillMatcher for a 30k+ skill export takes seconds, so the
+compiled matcher is pickled next to the taxonomy file together with the
+taxonomy's SHA-256. load_matcher reuses that artifact while the hash and
+format version match and rebuilds it otherwise.
+"""
+import csv
+import hashlib
+import io
+import json
+import os
+import pickle
+
+from skill_matcher import SkillMatcher
+
+# Bump when SkillMatcher's internal layout changes so old artifacts are rebuilt
+MATCHER_FORMAT_VERSION = 1
+ARTIFACT_SUFFIX = ".matcher.pkl"
+ALIAS_SEPARATOR = "|"
+
+
+def parse_taxonomy(data, fmt):
+    """(skills_db, aliases) from the raw bytes of a CSV or JSON taxonomy"""
+    skills_db, aliases, seen = {}, {}, set()
+
+    def add(category, skill, skill_aliases):
+        skill = skill.strip()
+        if not skill:
+            return
+        category = category.strip()
+        if (category, skill) not in seen:
+            seen.add((category, skill))
+            skills_db.setdefault(category, []).append(skill)
+        for alias in skill_aliases:
+            if alias.strip():
+                aliases[alias.strip()] = skill
+
+    if fmt == "json":
+        for category, entries in json.loads(data.decode("utf-8")).items():
+            for entry in entries:
+                if isinstance(entry, str):
+                    add(category, entry, [])
+                else:
+                    add(category, entry["skill"], entry.get("aliases", []))
+    else:
+        for row in csv.DictReader(io.StringIO(data.decode("utf-8-sig"))):
+            add(row["category"], row["skill"], (row.get("aliases") or "").split(ALIAS_SEPARATOR))
+    return skills_db, aliases
+
+
+def _taxonomy_format(path):
+    return "json" if path.lower().endswith(".json") else "csv"
+
+
+def load_taxonomy(path):
+    """(skills_db, aliases) read from a taxonomy file"""
+    with open(path, "rb") as f:
+        return parse_taxonomy(f.read(), _taxonomy_format(path))
+
+
+def _read_artifact(artifact_path, digest):
+    try:
+        with open(artifact_path, "rb") as f:
+            artifact = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Error loading matcher artifact: {e}")
+        return None
+    if artifact.get("version") != MATCHER_FORMAT_VERSION or artifact.get("sha256") != digest:
+        return None
+    return artifact["matcher"]
+
+
+def build_matcher(path, data=None):
+    """Compile a SkillMatcher for the taxonomy at path and save its artifact"""
+    if data is None:
+        with open(path, "rb") as f:
+            data = f.read()
+    skills_db, aliases = parse_taxonomy(data, _taxonomy_format(path))
+    matcher = SkillMatcher(skills_db, aliases)
+
+    artifact_path = path + ARTIFACT_SUFFIX
+    tmp_path = artifact_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump({
+                "version": MATCHER_FORMAT_VERSION,
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "matcher": matcher
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, artifact_path)
+    except OSError as e:
+        # A read-only taxonomy directory still gets a working matcher
+        print(f"Error saving matcher artifact: {e}")
+    return matcher
+
+
+def load_matcher(path):
+    """SkillMatcher for a taxonomy file, from its artifact when up to date"""
+    with open(path, "rb") as f:
+        data = f.read()
+    matcher = _read_artifact(path + ARTIFACT_SUFFIX, hashlib.sha256(data).hexdigest())
+    if matcher is None:
+        matcher = build_matcher(path, data)
+    return matcher
@@ -1,26 +1,116 @@
+import io
 import pdfplumber
 import re
+from concurrent.futures import ProcessPoolExecutor
 
-def extract_text_from_pdf(pdf_path):
-    """Extract text from PDF resume"""
-    text = ""
+# Hard limits so one oversized upload (e.g. a scanned CV pack) cannot stall a batch
+MAX_PDF_PAGES = 50
+MAX_TEXT_CHARS = 200_000
+# Documents with more pages than this are split across worker processes
+PAGES_PER_WORKER = 8
+
+def iter_pdf_pages(pdf_path, max_pages=MAX_PDF_PAGES, max_chars=MAX_TEXT_CHARS, start=0, stop=None,
+                   strict=False):
+    """Yield the text of each PDF page, stopping at the page or character limit
+
+    pdf_path can be a path or a file-like object. Pages without a text layer
+    yield an empty string. Each page's parsed layout is released as soon as
+    its text is read, so memory stays bounded by a single page. A PDF that
+    cannot be read is reported and ends the pages, or raises if strict.
+    """
+    chars = 0
     try:
         with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                text += page.extract_text()
+            stop = len(pdf.pages) if stop is None else min(stop, len(pdf.pages))
+            if max_pages is not None:
+                stop = min(stop, start + max_pages)
+            for page_number in range(start, stop):
+                page = pdf.pages[page_number]
+                text = page.extract_text() or ""
+                page.close()
+                if max_chars is not None and chars + len(text) >= max_chars:
+                    yield text[:max_chars - chars]
+                    return
+                chars += len(text)
+                yield text
+    except Exception as e:
+        if strict:
+            raise
+        print(f"Error reading PDF: {e}")
+
+def _extract_page_range(source, start, stop, max_chars):
+    """Worker: text of pages [start, stop) of a PDF given as a path or bytes"""
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    return list(iter_pdf_pages(source, max_pages=None, max_chars=max_chars, start=start, stop=stop))
+
+def _count_pages(source):
+    try:
+        with pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source) as pdf:
+            return len(pdf.pages)
     except Exception as e:
         print(f"Error reading PDF: {e}")
-    return text
+        return 0
+
+def iter_pdf_pages_parallel(source, workers=4, max_pages=MAX_PDF_PAGES, max_chars=MAX_TEXT_CHARS,
+                            pages_per_worker=PAGES_PER_WORKER):
+    """Like iter_pdf_pages, but large documents are split across processes
+
+    source is a path or the PDF's bytes. Page ranges are extracted in
+    parallel and yielded in page order; remaining ranges are cancelled once
+    the character limit is reached.
+    """
+    pdf = io.BytesIO(source) if isinstance(source, bytes) else source
+    if workers <= 1:
+        yield from iter_pdf_pages(pdf, max_pages=max_pages, max_chars=max_chars)
+        return
+
+    page_count = _count_pages(source)
+    if max_pages is not None:
+        page_count = min(page_count, max_pages)
+    if page_count <= pages_per_worker:
+        yield from iter_pdf_pages(pdf, max_pages=page_count, max_chars=max_chars)
+        return
+
+    chars = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_extract_page_range, source, start, min(start + pages_per_worker, page_count), max_chars)
+            for start in range(0, page_count, pages_per_worker)
+        ]
+        try:
+            for future in futures:
+                for text in future.result():
+                    if max_chars is not None and chars + len(text) >= max_chars:
+                        yield text[:max_chars - chars]
+                        return
+                    chars += len(text)
+                    yield text
+        finally:
+            for future in futures:
+                future.cancel()
+
+def extract_text_from_pdf(pdf_path, max_pages=MAX_PDF_PAGES, max_chars=MAX_TEXT_CHARS, strict=False):
+    """Extract text from PDF resume; strict raises on unreadable PDFs"""
+    return "\n".join(iter_pdf_pages(pdf_path, max_pages, max_chars, strict=strict))
 
 def extract_text_from_txt(txt_path):
     """Extract text from TXT resume"""
     with open(txt_path, 'r', encoding='utf-8') as f:
         return f.read()
 
+def extract_text_from_bytes(data, is_pdf, workers=1):
+    """Extract text from the raw bytes of an uploaded PDF or TXT resume"""
+    if is_pdf:
+        return "\n".join(iter_pdf_pages_parallel(data, workers=workers))
+    return data.decode('utf-8', errors='ignore')[:MAX_TEXT_CHARS]
+
 def clean_text(text):
-    """Clean and normalize text"""
+    """Clean and normalize text; also accepts an iterable of page texts"""
+    if not isinstance(text, str):
+        text = "\n".join(text)
     # Remove extra whitespace
     text = re.sub(r'\s+', ' ', text)
     # Remove special characters but keep alphanumeric and basic punctuation
     text = re.sub(r'[^\w\s.,;:()\-]', '', text)
-    return text.strip()
\ No newline at end of file
+    return text.strip()
@@ -0,0 +1,136 @@
+import json
+import os
+
+import joblib
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+VECTORIZER_FILE = "vectorizer.joblib"
+META_FILE = "meta.json"
+# CSR arrays, one raw binary file each. int32 indices keep scipy from copying
+# the mapped arrays (it downcasts int64 index arrays whenever they fit)
+ARRAY_FILES = {
+    "data": ("data.f32", np.float32),
+    "indices": ("indices.i32", np.int32),
+    "indptr": ("indptr.i32", np.int32)
+}
+
+
+class ResumeVectorStore:
+    """Corpus-level TF-IDF vectors of resumes in memory-mapped files.
+
+    The vectorizer is fitted once on the resumes the store is built from and
+    saved with joblib; appended resumes are transformed with that fixed
+    vocabulary and IDF. Vectors are L2-normalised CSR rows whose arrays are
+    read straight from disk with np.memmap, so opening a store and querying it
+    never loads or refits the corpus. meta.json records how many rows and
+    non-zeros are committed, so a torn append is ignored on the next open.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.vectorizer = joblib.load(self._path(VECTORIZER_FILE))
+        with open(self._path(META_FILE), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        self.ids = meta["ids"]
+        self._nnz = meta["nnz"]
+        self._map_arrays()
+
+    @classmethod
+    def build(cls, directory, documents, ids, **vectorizer_options):
+        """Fit the vectorizer on documents and create a store holding them"""
+        os.makedirs(directory, exist_ok=True)
+        vectorizer_options.setdefault("stop_words", "english")
+        vectorizer = TfidfVectorizer(**vectorizer_options)
+        vectors = vectorizer.fit_transform(documents)
+        joblib.dump(vectorizer, os.path.join(directory, VECTORIZER_FILE))
+
+        for filename, _ in ARRAY_FILES.values():
+            open(os.path.join(directory, filename), "wb").close()
+        with open(os.path.join(directory, ARRAY_FILES["indptr"][0]), "wb") as f:
+            np.zeros(1, dtype=np.int32).tofile(f)
+        cls._write_meta(directory, [], 0)
+
+        store = cls(directory)
+        store._append_vectors(vectors, list(ids))
+        return store
+
+    def _path(self, filename):
+        return os.path.join(self.directory, filename)
+
+    @staticmethod
+    def _write_meta(directory, ids, nnz):
+        path = os.path.join(directory, META_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"ids": ids, "nnz": nnz}, f)
+        os.replace(path + ".tmp", path)
+
+    def _map(self, name, count):
+        filename, dtype = ARRAY_FILES[name]
+        if count == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(self._path(filename), dtype=dtype, mode="r", shape=(count,))
+
+    def _map_arrays(self):
+        self.matrix = sparse.csr_matrix(
+            (self._map("data", self._nnz), self._map("indices", self._nnz), self._map("indptr", len(self.ids) + 1)),
+            shape=(len(self.ids), len(self.vectorizer.vocabulary_)),
+            copy=False
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    def append(self, documents, ids):
+        """Vectorize new resumes with the fitted vocabulary and add them"""
+        ids = list(ids)
+        documents = list(documents)
+        if len(documents) != len(ids):
+            raise ValueError("documents and ids must have the same length")
+        if documents:
+            self._append_vectors(self.vectorizer.transform(documents), ids)
+
+    def _append_vectors(self, vectors, ids):
+        vectors = vectors.tocsr()
+        nnz = self._nnz + vectors.nnz
+        if nnz > np.iinfo(np.int32).max:
+            raise ValueError("vector store is full (int32 index limit)")
+
+        # Drop the mapping before touching the files, then append past the
+        # committed sizes; anything beyond them is an earlier torn append
+        self.matrix = None
+        arrays = {
+            "data": vectors.data,
+            "indices": vectors.indices,
+            "indptr": vectors.indptr[1:] + self._nnz
+        }
+        committed = {"data": self._nnz, "indices": self._nnz, "indptr": len(self.ids) + 1}
+        for name, values in arrays.items():
+            filename, dtype = ARRAY_FILES[name]
+            with open(self._path(filename), "r+b") as f:
+                f.truncate(committed[name] * np.dtype(dtype).itemsize)
+                f.seek(0, os.SEEK_END)
+                np.asarray(values, dtype=dtype).tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+
+        # meta.json is the commit point
+        self._write_meta(self.directory, self.ids + ids, nnz)
+        self.ids = self.ids + ids
+        self._nnz = nnz
+        self._map_arrays()
+
+    def query(self, text, k=10):
+        """Top-k stored resumes by cosine similarity to text, best first"""
+        k = min(k, len(self.ids))
+        if k == 0:
+            return []
+        query = self.vectorizer.transform([text])
+        scores = (self.matrix @ query.T).toarray().ravel()
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.lexsort((top, -scores[top]))]
+        return [
+            {"resume_id": self.ids[i], "similarity": round(float(scores[i]) * 100, 2)}
+            for i in top
+        ]
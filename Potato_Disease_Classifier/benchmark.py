@@ -0,0 +1,66 @@
+"""Per-image latency and images/sec of the classifier's inference paths.
+
+    predict   MODEL.predict on one float64 image, as main.py used to
+    infer     the traced infer() on one float32 image
+    batch N   infer() on N images at once (what Gradio's batch mode sends)
+
+Run with:  python benchmark.py --images 200 --batch-sizes 8 16 32
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+from PIL import Image
+
+import main as classifier
+
+SAMPLE_IMAGE = os.path.join(classifier.BASE_DIR, "Potato-field.jpg")
+
+
+def report(name, seconds, images):
+    """Print latency per image and throughput from per-call timings"""
+    per_image = np.array(seconds) / (images / len(seconds)) * 1000
+    p50, p95 = np.percentile(per_image, [50, 95])
+    print(f"{name:>10} {p50:10.2f} {p95:10.2f} {images / sum(seconds):12.1f}")
+
+
+def timed(fn, calls):
+    seconds = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        seconds.append(time.perf_counter() - start)
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Potato classifier inference benchmark")
+    parser.add_argument("--images", type=int, default=200, help="images per path")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[8, 16, 32])
+    args = parser.parse_args()
+
+    image = Image.open(SAMPLE_IMAGE)
+    legacy = np.expand_dims(np.array(image.convert("RGB").resize((classifier.IMAGE_SIZE, classifier.IMAGE_SIZE))) / 255.0, 0)
+    single = classifier.preprocess(image)[None]
+
+    # Warm both paths outside the timings
+    classifier.MODEL.predict(legacy, verbose=0)
+    classifier.infer(single)
+
+    print(f"{'path':>10} {'p50 ms/img':>10} {'p95 ms/img':>10} {'images/sec':>12}")
+    report("predict", timed(lambda: classifier.MODEL.predict(legacy, verbose=0), args.images), args.images)
+    report("infer", timed(lambda: classifier.infer(single).numpy(), args.images), args.images)
+    report("preprocess", timed(lambda: classifier.preprocess(image), args.images), args.images)
+    for size in args.batch_sizes:
+        calls = max(1, args.images // size)
+        batch = np.repeat(single, size, axis=0)
+        report(f"batch {size}", timed(lambda: classifier.infer(batch).numpy(), calls), calls * size)
+    # End to end through the Gradio function, preprocessing included
+    size = classifier.MAX_BATCH_SIZE
+    calls = max(1, args.images // size)
+    report(f"gradio {size}", timed(lambda: classifier.predict_images([image] * size), calls), calls * size)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,24 +11,43 @@ MODEL_PATH = os.path.join(BASE_DIR, "potatoes.h5")
 # Load model once
 MODEL = tf.keras.models.load_model(MODEL_PATH)
 CLASS_NAMES = ["Early Blight", "Late Blight", "Healthy"]
+IMAGE_SIZE = 256
+
+# Concurrent uploads are grouped into one forward pass of up to this many images
+MAX_BATCH_SIZE = int(os.environ.get("POTATO_MAX_BATCH_SIZE", "16"))
+
+# Traced once for any batch size: no Keras predict() setup per call
+@tf.function(input_signature=[tf.TensorSpec([None, IMAGE_SIZE, IMAGE_SIZE, 3], tf.float32)])
+def infer(images):
+    return MODEL(images, training=False)
+
+infer(tf.zeros([1, IMAGE_SIZE, IMAGE_SIZE, 3]))  # trace at startup, not on the first upload
+
+def preprocess(image: Image.Image):
+    # Raw 0-255 pixels: the model starts with its own Rescaling(1/255) layer
+    image = image.convert("RGB").resize((IMAGE_SIZE, IMAGE_SIZE))
+    return np.asarray(image, dtype=np.float32)
+
+# Batched prediction function (Gradio passes a list of images)
+def predict_images(images):
+    batch = np.stack([preprocess(image) for image in images])
+    predictions = infer(batch).numpy()
+    labels = [{CLASS_NAMES[np.argmax(p)]: float(np.max(p))} for p in predictions]
+    return [labels]
 
 # Prediction function
 def predict_image(image: Image.Image):
-    image = image.resize((256, 256))        # Resize if needed
-    img_array = np.array(image) / 255.0
-    img_batch = np.expand_dims(img_array, 0)
-    predictions = MODEL.predict(img_batch)
-    predicted_class = CLASS_NAMES[np.argmax(predictions[0])]
-    confidence = float(np.max(predictions[0]))
-    return {predicted_class: confidence}
+    return predict_images([image])[0][0]
 
 # Gradio interface
 demo = gr.Interface(
-    fn=predict_image,
+    fn=predict_images,
     inputs=gr.Image(type="pil", label="Upload Potato Leaf"),
     outputs=gr.Label(num_top_classes=3),
     title="Potato Disease Classifier",
-    description="Upload a potato leaf image to detect Early Blight, Late Blight, or Healthy leaf."
+    description="Upload a potato leaf image to detect Early Blight, Late Blight, or Healthy leaf.",
+    batch=True,
+    max_batch_size=MAX_BATCH_SIZE
 )
 
 if __name__ == "__main__":
@@ -1,9 +1,30 @@
+import os
 import gradio as gr
 import util
+from price_lattice import load_lattice
+from micro_batcher import MicroBatcher, MAX_BATCH_SIZE
 
 # Load artifacts when app starts
 util.load_saved_artifacts()
 
+# Optional precomputed price grid: PRICE_LATTICE=1 serves slider/dropdown
+# combinations from a memory-mapped table, building it first if missing or stale.
+# PRICE_LATTICE_BUILD=0 only opens a current one (serve_workers builds it before forking)
+PRICE_LATTICE = os.environ.get("PRICE_LATTICE", "0") == "1"
+PRICE_LATTICE_BUILD = os.environ.get("PRICE_LATTICE_BUILD", "1") == "1"
+lattice = load_lattice(build_missing=PRICE_LATTICE_BUILD) if PRICE_LATTICE else None
+
+# Concurrent predict requests are coalesced into one model call per window
+# (PRICE_BATCH_WINDOW_MS / PRICE_MAX_BATCH_SIZE); PRICE_MICRO_BATCHING=0 turns it off
+PRICE_MICRO_BATCHING = os.environ.get("PRICE_MICRO_BATCHING", "1") == "1"
+batcher = MicroBatcher() if PRICE_MICRO_BATCHING else None
+
+# PRICE_MODEL_WATCH_SECONDS > 0 polls artifacts/registry and hot-swaps to new
+# model versions without a restart
+PRICE_MODEL_WATCH_SECONDS = float(os.environ.get("PRICE_MODEL_WATCH_SECONDS", "0"))
+if PRICE_MODEL_WATCH_SECONDS > 0:
+    util.get_predictor().watch(PRICE_MODEL_WATCH_SECONDS)
+
 # Current exchange rate (INR to USD)
 INR_TO_USD_RATE = 0.01171  # 1 INR = 0.01171 USD
 
@@ -28,8 +49,7 @@ def predict_price(company, type_name, ram, touchscreen, ips, total_storage,
                 error_msg += f"  • {error}\n"
             return error_msg
         
-        # Make prediction (returns price in INR)
-        estimated_price_inr = util.get_estimated_price(
+        features = dict(
             company=company,
             ram=int(ram),
             touchscreen=int(touchscreen),
@@ -41,6 +61,15 @@ def predict_price(company, type_name, ram, touchscreen, ips, total_storage,
             os_type=os_type
         )
         
+        # Make prediction (returns price in INR); grid hits skip the model,
+        # unless the grid was priced with a model version no longer live
+        current = lattice is not None and lattice.is_current()
+        estimated_price_inr = lattice.lookup(**features) if current else None
+        if estimated_price_inr is None and batcher is not None:
+            estimated_price_inr = batcher.predict(**features)
+        elif estimated_price_inr is None:
+            estimated_price_inr = util.get_estimated_price(**features)
+        
         if estimated_price_inr is None:
             return "❌ **Prediction failed.** Please check your inputs and try again."
         
@@ -78,6 +107,33 @@ def predict_price(company, type_name, ram, touchscreen, ips, total_storage,
     except Exception as e:
         return f"❌ **Error:** {str(e)}\n\nPlease check your inputs and try again."
 
+def serving_metrics():
+    """Live model version plus micro-batching queue depth, batch sizes and latency"""
+    metrics = {"model_version": util.get_model_version()}
+    if batcher is None:
+        return {**metrics, "micro_batching": False}
+    return {**metrics, "micro_batching": True, **batcher.metrics()}
+
+def price_sensitivity(company, type_name, ram, touchscreen, ips, total_storage,
+                      cpu_brand, gpu_brand, os_type):
+    """
+    Price curves (USD) across every RAM step, storage step, CPU and GPU brand
+    """
+    curves = util.price_sensitivity(
+        company=company,
+        ram=int(ram),
+        touchscreen=int(touchscreen),
+        ips=int(ips),
+        total_storage=int(total_storage),
+        type_name=type_name,
+        cpu_brand=cpu_brand,
+        gpu_brand=gpu_brand,
+        os_type=os_type
+    )
+    for curve in curves.values():
+        curve['Price (USD)'] = (curve.pop('Price') * INR_TO_USD_RATE).round(2)
+    return curves['Ram'], curves['Total_Storage'], curves['Cpu brand'], curves['Gpu brand']
+
 # Get options from util
 companies = util.get_company_names()
 type_names = util.get_type_names()
@@ -117,19 +173,19 @@ with gr.Blocks(title="Laptop Price Predictor", theme=gr.themes.Soft()) as demo:
             gr.Markdown("### 🔧 Hardware Specifications")
             
             ram = gr.Slider(
-                minimum=2,
-                maximum=64,
+                minimum=util.RAM_OPTIONS.start,
+                maximum=util.RAM_OPTIONS[-1],
                 value=8,
-                step=2,
+                step=util.RAM_OPTIONS.step,
                 label="RAM (GB)",
                 info="Memory capacity"
             )
             
             total_storage = gr.Slider(
-                minimum=128,
+                minimum=util.STORAGE_OPTIONS.start,
                 maximum=2000,
                 value=512,
-                step=128,
+                step=util.STORAGE_OPTIONS.step,
                 label="Total Storage (GB)",
                 info="HDD + SSD combined storage"
             )
@@ -145,14 +201,14 @@ with gr.Blocks(title="Laptop Price Predictor", theme=gr.themes.Soft()) as demo:
             gr.Markdown("### 🖥️ Display & Graphics")
             
             touchscreen = gr.Radio(
-                choices=[(0, "No"), (1, "Yes")],
+                choices=[("No", 0), ("Yes", 1)],
                 label="Touchscreen",
                 value=0,
                 info="Does it have touchscreen capability?"
             )
             
             ips = gr.Radio(
-                choices=[(0, "No"), (1, "Yes")],
+                choices=[("No", 0), ("Yes", 1)],
                 label="IPS Display",
                 value=1,
                 info="In-Plane Switching display technology"
@@ -180,19 +236,48 @@ with gr.Blocks(title="Laptop Price Predictor", theme=gr.themes.Soft()) as demo:
                 size="lg",
                 scale=2
             )
+            
+            sensitivity_btn = gr.Button(
+                "📈 What-if Sensitivity",
+                variant="secondary",
+                size="lg"
+            )
     
     output = gr.Markdown(
         label="Prediction Result",
         value="*Enter specifications and click 'Predict Price' to get an estimate*"
     )
     
+    # Enough concurrent handlers to fill a micro-batch
     predict_btn.click(
         fn=predict_price,
         inputs=[company, type_name, ram, touchscreen, ips, total_storage, 
                 cpu_brand, gpu_brand, os_type],
-        outputs=output
+        outputs=output,
+        concurrency_limit=MAX_BATCH_SIZE if batcher is not None else 1
     )
     
+    # What-if view: all curves come from one batched model call
+    gr.Markdown("### 📈 Price Sensitivity")
+    with gr.Row():
+        ram_curve = gr.LinePlot(x="Ram", y="Price (USD)", title="Price vs RAM (GB)")
+        storage_curve = gr.LinePlot(x="Total_Storage", y="Price (USD)", title="Price vs Total Storage (GB)")
+    with gr.Row():
+        cpu_curve = gr.BarPlot(x="Cpu brand", y="Price (USD)", title="Price by CPU")
+        gpu_curve = gr.BarPlot(x="Gpu brand", y="Price (USD)", title="Price by GPU")
+    
+    sensitivity_btn.click(
+        fn=price_sensitivity,
+        inputs=[company, type_name, ram, touchscreen, ips, total_storage,
+                cpu_brand, gpu_brand, os_type],
+        outputs=[ram_curve, storage_curve, cpu_curve, gpu_curve]
+    )
+    
+    with gr.Accordion("⚙️ Serving Metrics", open=False):
+        metrics_json = gr.JSON(label="Model and micro-batching")
+        metrics_btn = gr.Button("🔄 Refresh", size="sm")
+    metrics_btn.click(fn=serving_metrics, inputs=None, outputs=metrics_json)
+    
     gr.HTML("""
         <div style="text-align: center; margin-top: 30px; padding: 20px; 
                     background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
@@ -0,0 +1,144 @@
+"""Score laptop listing files in bulk.
+
+Reads a CSV or Parquet file in fixed-size chunks, prices each chunk with
+one batched model call in a pool of worker processes and appends the
+chunk, with a Price column, to the output file as soon as it is done.
+Only a bounded number of chunks are in memory at once, so memory does not
+grow with the input size. The input needs the raw feature columns
+Company, TypeName, Cpu brand, Gpu brand, os, Touchscreen, Ips, Ram and
+Total_Storage; other columns are passed through. Categories the model was
+not trained with score as the baseline category, as in util.predict_prices.
+
+    python bulk_score.py listings.csv prices.csv
+    python bulk_score.py listings.parquet prices.parquet --chunk-size 200000 --workers 8
+"""
+import argparse
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+import util
+from price_lattice import AXES
+
+CHUNK_SIZE = 100_000
+# Chunks queued per worker: keeps workers busy without buffering the file
+IN_FLIGHT_PER_WORKER = 2
+
+
+def _is_parquet(path):
+    return path.lower().endswith((".parquet", ".pq"))
+
+
+def read_chunks(path, chunk_size=CHUNK_SIZE):
+    """DataFrames of at most chunk_size rows from a CSV or Parquet file"""
+    if not _is_parquet(path):
+        yield from pd.read_csv(path, chunksize=chunk_size)
+        return
+    import pyarrow.parquet as pq
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        yield batch.to_pandas()
+
+
+class ChunkWriter:
+    """Append DataFrames to a CSV or Parquet file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._parquet = None
+        self._started = False
+
+    def write(self, frame):
+        if not _is_parquet(self.path):
+            frame.to_csv(self.path, mode="a" if self._started else "w", header=not self._started, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            if self._parquet is None:
+                table = pa.Table.from_pandas(frame, preserve_index=False)
+                self._parquet = pq.ParquetWriter(self.path, table.schema)
+            else:
+                # CSV-typed chunks can infer different dtypes; keep the first chunk's schema
+                table = pa.Table.from_pandas(frame, schema=self._parquet.schema, preserve_index=False)
+            self._parquet.write_table(table)
+        self._started = True
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+
+
+def _init_worker():
+    # Forked workers inherit the parent's loaded model
+    if util.get_predictor() is None:
+        util.load_saved_artifacts()
+
+
+def score_features(features):
+    """Prices for a dict of raw feature column -> array"""
+    return util.predict_prices(**{arg: features[name] for name, arg in AXES.items()})
+
+
+def _features(frame):
+    missing = [name for name in AXES if name not in frame.columns]
+    if missing:
+        raise ValueError(f"input is missing feature columns: {missing}")
+    # Only the feature arrays travel to the worker, not the whole chunk
+    return {name: frame[name].to_numpy() for name in AXES}
+
+
+def score_file(input_path, output_path, chunk_size=CHUNK_SIZE, workers=os.cpu_count()):
+    """Score input_path into output_path chunk by chunk; returns the row count
+
+    workers=0 scores in this process.
+    """
+    _init_worker()
+    writer = ChunkWriter(output_path)
+    rows = 0
+    try:
+        if not workers:
+            for frame in read_chunks(input_path, chunk_size):
+                frame["Price"] = score_features(_features(frame))
+                writer.write(frame)
+                rows += len(frame)
+            return rows
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            pending = deque()
+
+            def write_oldest():
+                frame, future = pending.popleft()
+                frame["Price"] = future.result()
+                writer.write(frame)
+                return len(frame)
+
+            # Results are written in input order; reading waits while the queue is full
+            for frame in read_chunks(input_path, chunk_size):
+                pending.append((frame, pool.submit(score_features, _features(frame))))
+                if len(pending) >= workers * IN_FLIGHT_PER_WORKER:
+                    rows += write_oldest()
+            while pending:
+                rows += write_oldest()
+        return rows
+    finally:
+        writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a CSV or Parquet file of laptop listings")
+    parser.add_argument("input", help="CSV or Parquet file with the raw feature columns")
+    parser.add_argument("output", help="CSV or Parquet file to write (input columns plus Price)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="0 scores in this process")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows = score_file(args.input, args.output, args.chunk_size, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"Scored {rows} listings in {elapsed:.1f}s ({rows / elapsed:.0f}/s) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
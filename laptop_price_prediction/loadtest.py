@@ -0,0 +1,266 @@
+"""Load test for the laptop price predictor.
+
+Fires request mixes at a target with a pool of concurrent clients and
+reports p50/p95/p99 latency and requests per second for each concurrency
+level, plus the single-request cost of encoding, scaling and the model.
+
+Targets:
+    util     util.get_estimated_price in this process
+    handler  the Gradio predict_price handler in this process (lattice and
+             micro-batching follow PRICE_LATTICE / PRICE_MICRO_BATCHING)
+    http     a running app through gradio_client (--url), or one started
+             here on --port with --launch
+
+Mixes:
+    repeat   one configuration over and over
+    random   random dropdown, radio and slider values
+    offgrid  random, with RAM and storage values between slider steps
+
+    python loadtest.py --targets util handler --concurrency 1 8 32 --json run.json
+    python loadtest.py --targets http --launch --requests 500 --compare run.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import util
+from price_lattice import AXES
+
+TARGETS = ("util", "handler", "http")
+MIXES = ("repeat", "random", "offgrid")
+STAGE_SAMPLES = 2000
+
+
+def make_requests(mix, count, seed=0):
+    """count get_estimated_price keyword dicts drawn from a mix"""
+    rng = random.Random(seed)
+    base = dict(company='Dell', ram=8, touchscreen=0, ips=1, total_storage=512, type_name='Notebook',
+                cpu_brand='Intel Core i5', gpu_brand='Nvidia', os_type='Windows')
+    requests = []
+    for _ in range(count):
+        if mix == "repeat":
+            requests.append(dict(base))
+            continue
+        request = dict(
+            company=rng.choice(util.get_company_names()),
+            ram=rng.choice(util.RAM_OPTIONS),
+            touchscreen=rng.randint(0, 1),
+            ips=rng.randint(0, 1),
+            total_storage=rng.choice(util.STORAGE_OPTIONS),
+            type_name=rng.choice(util.get_type_names()),
+            cpu_brand=rng.choice(util.get_cpu_brands()),
+            gpu_brand=rng.choice(util.get_gpu_brands()),
+            os_type=rng.choice(util.get_os_types())
+        )
+        if mix == "offgrid":
+            request['ram'] += 1
+            request['total_storage'] += 64
+        requests.append(request)
+    return requests
+
+
+def _handler_args(request):
+    return (request['company'], request['type_name'], request['ram'], request['touchscreen'], request['ips'],
+            request['total_storage'], request['cpu_brand'], request['gpu_brand'], request['os_type'])
+
+
+def make_target(name, url=None):
+    """A callable taking one request dict; raises or returns None on failure"""
+    if name == "util":
+        return lambda request: util.get_estimated_price(**request)
+    if name == "handler":
+        import app
+
+        def call(request):
+            result = app.predict_price(*_handler_args(request))
+            return None if result.lstrip().startswith("❌") else result
+        return call
+
+    from gradio_client import Client
+    clients = threading.local()
+
+    def call(request):
+        # One client per load-test thread: clients hold a session
+        if not hasattr(clients, "client"):
+            clients.client = Client(url, verbose=False)
+        result = clients.client.predict(*_handler_args(request), api_name="/predict_price")
+        return None if result.lstrip().startswith("❌") else result
+    return call
+
+
+def run_load(call, requests, concurrency):
+    """Latency percentiles and throughput of requests sent by concurrency clients"""
+    latencies = [0.0] * len(requests)
+    errors = [0]
+    next_index = iter(range(len(requests)))
+    lock = threading.Lock()
+
+    def client():
+        while True:
+            with lock:
+                i = next(next_index, None)
+            if i is None:
+                return
+            start = time.perf_counter()
+            try:
+                ok = call(requests[i]) is not None
+            except Exception:
+                ok = False
+            latencies[i] = time.perf_counter() - start
+            if not ok:
+                with lock:
+                    errors[0] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(client)
+    elapsed = time.perf_counter() - start
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+    return {
+        "concurrency": concurrency,
+        "requests": len(requests),
+        "errors": errors[0],
+        "rps": round(len(requests) / elapsed, 1),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3)
+    }
+
+
+def stage_costs(requests):
+    """Mean single-request microseconds for encoding, scaling and the model"""
+    snapshot = util.get_predictor().snapshot
+    totals = {"encode_us": 0.0, "scale_us": 0.0, "model_us": 0.0}
+    for request in requests:
+        features = {name: request[arg] for name, arg in AXES.items()}
+        t0 = time.perf_counter()
+        X = snapshot.encode(features, scale=False)
+        t1 = time.perf_counter()
+        snapshot.scale(X)
+        t2 = time.perf_counter()
+        snapshot.model.predict(X)
+        t3 = time.perf_counter()
+        totals["encode_us"] += t1 - t0
+        totals["scale_us"] += t2 - t1
+        totals["model_us"] += t3 - t2
+    stages = {name: round(total / len(requests) * 1e6, 1) for name, total in totals.items()}
+    stages["scaler"] = snapshot.scaler is not None
+    return stages
+
+
+def launch_app(port):
+    """Start app.py on port and wait until it answers; returns the process"""
+    env = dict(os.environ, GRADIO_SERVER_PORT=str(port))
+    proc = subprocess.Popen([sys.executable, "app.py"], cwd=os.path.dirname(os.path.abspath(__file__)), env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    import urllib.request
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("app.py exited during startup")
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1)
+            return proc
+        except OSError:
+            time.sleep(0.5)
+    proc.terminate()
+    raise RuntimeError("app.py did not start within 120s")
+
+
+def compare(report, baseline):
+    """Print p50/p99/rps changes against a baseline report"""
+    before = {(run["target"], run["mix"], run["concurrency"]): run for run in baseline.get("runs", [])}
+    print("\nChange vs baseline (latency: positive = slower; rps: positive = faster)")
+    print(f"{'target':>8} {'mix':>8} {'conc':>5} {'p50':>8} {'p99':>8} {'rps':>8}")
+    for run in report["runs"]:
+        old = before.get((run["target"], run["mix"], run["concurrency"]))
+        if not old:
+            continue
+        change = {key: (run[key] / old[key] - 1) * 100 if old[key] else 0.0 for key in ("p50_ms", "p99_ms", "rps")}
+        print(f"{run['target']:>8} {run['mix']:>8} {run['concurrency']:>5} "
+              f"{change['p50_ms']:+7.1f}% {change['p99_ms']:+7.1f}% {change['rps']:+7.1f}%")
+    for name in ("encode_us", "scale_us", "model_us"):
+        if baseline.get("stages", {}).get(name):
+            print(f"{name:>10} {(report['stages'][name] / baseline['stages'][name] - 1) * 100:+7.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latency/throughput load test for the price predictor")
+    parser.add_argument("--targets", nargs="+", choices=TARGETS, default=["util", "handler"])
+    parser.add_argument("--mixes", nargs="+", choices=MIXES, default=["repeat", "random"])
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=2000, help="requests per target, mix and concurrency")
+    parser.add_argument("--url", default="http://127.0.0.1:7860/", help="app for the http target")
+    parser.add_argument("--launch", action="store_true", help="start app.py on --port for the http target")
+    parser.add_argument("--port", type=int, default=7861)
+    parser.add_argument("--json", help="save results to this file")
+    parser.add_argument("--compare", help="baseline JSON from an earlier --json run")
+    args = parser.parse_args()
+
+    # get_estimated_price prints every prediction; keep it out of the report
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    util.load_saved_artifacts()
+    report = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+            "model_version": util.get_model_version(),
+            "env": {name: os.environ[name] for name in sorted(os.environ) if name.startswith("PRICE_")}
+        },
+        "stages": stage_costs(make_requests("random", STAGE_SAMPLES, seed=1)),
+        "runs": []
+    }
+    app_proc = None
+    try:
+        if "http" in args.targets and args.launch:
+            app_proc = launch_app(args.port)
+            args.url = f"http://127.0.0.1:{args.port}/"
+        print(f"{'target':>8} {'mix':>8} {'conc':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'rps':>9} {'errors':>7}",
+              file=stdout)
+        for target in args.targets:
+            call = make_target(target, args.url)
+            call(make_requests("repeat", 1)[0])  # connect / build lazily-created state outside the timings
+            for mix in args.mixes:
+                requests = make_requests(mix, args.requests)
+                for concurrency in args.concurrency:
+                    run = {"target": target, "mix": mix, **run_load(call, requests, concurrency)}
+                    report["runs"].append(run)
+                    print(f"{target:>8} {mix:>8} {concurrency:>5} {run['p50_ms']:9.2f} {run['p95_ms']:9.2f} "
+                          f"{run['p99_ms']:9.2f} {run['rps']:9.1f} {run['errors']:7}", file=stdout)
+    finally:
+        if app_proc is not None:
+            app_proc.terminate()
+            app_proc.wait()
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    stages = report["stages"]
+    print(f"\nSingle request: encode {stages['encode_us']:.1f}us, "
+          f"scale {stages['scale_us']:.1f}us{'' if stages['scaler'] else ' (no scaler.pkl)'}, "
+          f"model {stages['model_us']:.1f}us")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+
+import util
+
+# How long the first request of a batch waits for company, and the batch cap
+BATCH_WINDOW_MS = float(os.environ.get("PRICE_BATCH_WINDOW_MS", "5"))
+MAX_BATCH_SIZE = int(os.environ.get("PRICE_MAX_BATCH_SIZE", "64"))
+METRIC_SAMPLES = 1000
+
+
+def predict_laptops(requests):
+    """Price a list of get_estimated_price keyword dicts with one model call"""
+    columns = {name: [request[name] for request in requests] for name in requests[0]}
+    return util.predict_prices(**columns).tolist()
+
+
+class MicroBatcher:
+    """Coalesce concurrent single predictions into batched model calls.
+
+    Callers submit one request and get a Future. A worker thread takes the
+    first waiting request, collects whatever else arrives within `window_ms`
+    (up to `max_batch_size` requests), runs them as one predict_batch call
+    and resolves each caller's Future with its own result.
+    """
+
+    def __init__(self, predict_batch=predict_laptops, max_batch_size=MAX_BATCH_SIZE, window_ms=BATCH_WINDOW_MS):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.window = window_ms / 1000
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._batch_sizes = deque(maxlen=METRIC_SAMPLES)
+        self._latencies = deque(maxlen=METRIC_SAMPLES)
+        self._requests = 0
+        self._batches = 0
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="price-micro-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, **request):
+        """Queue one request; the Future resolves to its prediction"""
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed")
+        future = Future()
+        self._queue.put((request, future, time.perf_counter()))
+        return future
+
+    def predict(self, timeout=None, **request):
+        """Submit one request and wait for its prediction"""
+        return self.submit(**request).result(timeout)
+
+    def _collect(self):
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.perf_counter() + self.window
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                # Finish this batch, then stop
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            try:
+                results = self.predict_batch([request for request, _, _ in batch])
+            except Exception:
+                # Retry one by one so a single bad request fails only its caller
+                for request, future, _ in batch:
+                    try:
+                        future.set_result(self.predict_batch([request])[0])
+                    except Exception as e:
+                        future.set_exception(e)
+            else:
+                for (_, future, _), result in zip(batch, results):
+                    future.set_result(result)
+
+            done = time.perf_counter()
+            with self._lock:
+                self._batches += 1
+                self._requests += len(batch)
+                self._batch_sizes.append(len(batch))
+                self._latencies.extend(done - submitted for _, _, submitted in batch)
+
+    def metrics(self):
+        """Queue depth plus batch size and request latency over recent batches"""
+        with self._lock:
+            sizes = list(self._batch_sizes)
+            latencies = list(self._latencies)
+            metrics = {"queue_depth": self._queue.qsize(), "requests": self._requests, "batches": self._batches}
+        if sizes:
+            p50, p95 = np.percentile(latencies, [50, 95]) * 1000
+            metrics.update({
+                "mean_batch_size": round(float(np.mean(sizes)), 2),
+                "max_batch_size": max(sizes),
+                "latency_p50_ms": round(float(p50), 3),
+                "latency_p95_ms": round(float(p95), 3)
+            })
+        return metrics
+
+    def close(self):
+        """Stop the worker after the requests already queued"""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._worker.join()
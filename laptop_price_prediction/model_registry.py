@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+
+import joblib
+import numpy as np
+
+ARTIFACTS_DIR = os.path.join(os.path.dirname(__file__), "artifacts")
+# One sub-directory per model version, each with best_model.pkl,
+# input_columns.json and optionally scaler.pkl; the highest name is newest
+REGISTRY_DIR = os.path.join(ARTIFACTS_DIR, "registry")
+WARMUP_BATCH_SIZES = (1, 16, 256)
+
+# Raw input feature -> one-hot column prefix used in input_columns.json
+CATEGORICAL_PREFIXES = {
+    'Company': 'Company_',
+    'TypeName': 'TypeName_',
+    'Cpu brand': 'Cpu brand_',
+    'Gpu brand': 'Gpu brand_',
+    'os': 'os_'
+}
+SCALED_FEATURES = ['Ram', 'Total_Storage']
+
+
+def column_layout(columns):
+    """Column positions for encoding: (numeric feature -> index, feature -> {category -> index})
+
+    Categories missing from the columns are the baseline dropped by
+    drop_first at training time and encode as all zeros.
+    """
+    numeric = {}
+    one_hot = {feature: {} for feature in CATEGORICAL_PREFIXES}
+    for index, col in enumerate(columns):
+        for feature, prefix in CATEGORICAL_PREFIXES.items():
+            if col.startswith(prefix):
+                one_hot[feature][col[len(prefix):]] = index
+                break
+        else:
+            numeric[col] = index
+    return numeric, one_hot
+
+
+class ModelSnapshot:
+    """One loaded model version with its columns, scaler and encoding layout.
+
+    Never modified after loading, so requests holding a snapshot are
+    unaffected when the predictor swaps in another one.
+    """
+
+    def __init__(self, directory, version):
+        self.version = version
+        self.directory = directory
+        digest = hashlib.sha256()
+
+        model_path = os.path.join(directory, "best_model.pkl")
+        with open(model_path, "rb") as f:
+            digest.update(f.read())
+        self.model = joblib.load(model_path)
+
+        with open(os.path.join(directory, "input_columns.json"), "rb") as f:
+            data = f.read()
+        digest.update(data)
+        self.columns = json.loads(data)
+        self.numeric, self.one_hot = column_layout(self.columns)
+        self.categories = {feature: list(positions) for feature, positions in self.one_hot.items()}
+
+        scaler_path = os.path.join(directory, "scaler.pkl")
+        self.scaler = None
+        if os.path.exists(scaler_path):
+            with open(scaler_path, 'rb') as f:
+                data = f.read()
+            digest.update(data)
+            self.scaler = pickle.loads(data)
+        self.fingerprint = digest.hexdigest()
+
+    def encode(self, laptop_features, scale=True):
+        """Model input matrix for a dict of feature -> value or per-laptop sequence"""
+        values = {name: np.asarray(value) for name, value in laptop_features.items()}
+        n_rows = max((value.size for value in values.values()), default=1)
+        X = np.zeros((n_rows, len(self.columns)))
+
+        for name, index in self.numeric.items():
+            if name in values:
+                X[:, index] = np.broadcast_to(values[name], (n_rows,))
+
+        rows = np.arange(n_rows)
+        for feature, positions in self.one_hot.items():
+            if feature not in values:
+                continue
+            categories = np.broadcast_to(values[feature], (n_rows,))
+            cols = np.array([positions.get(category, -1) for category in categories.tolist()], dtype=np.intp)
+            hit = cols >= 0
+            X[rows[hit], cols[hit]] = 1
+
+        return self.scale(X) if scale else X
+
+    def scale(self, X):
+        """Scale the numeric columns of an encoded matrix in place"""
+        if self.scaler is not None:
+            scaled = [self.numeric[name] for name in SCALED_FEATURES]
+            X[:, scaled] = self.scaler.transform(X[:, scaled])
+        return X
+
+    def predict(self, laptop_features):
+        """Raw model predictions for encoded laptop features"""
+        return self.model.predict(self.encode(laptop_features))
+
+    def warm_up(self, batch_sizes=WARMUP_BATCH_SIZES):
+        """Run a few dummy batches so the first real request pays no first-call cost"""
+        dummy = {feature: categories[0] for feature, categories in self.categories.items() if categories}
+        dummy.update({name: 0 for name in self.numeric})
+        for size in batch_sizes:
+            self.predict({**dummy, 'Ram': np.full(size, 8)})
+
+
+class PricePredictor:
+    """Thread-safe holder of the live model snapshot.
+
+    Versions are loaded from REGISTRY_DIR/<version>/, or from the flat
+    artifacts directory when there is no registry. activate() loads and warms
+    a version before publishing it with a single reference swap, so requests
+    in flight finish on the snapshot they started with and new requests never
+    wait for a load.
+    """
+
+    def __init__(self, registry_dir=REGISTRY_DIR, fallback_dir=ARTIFACTS_DIR):
+        self.registry_dir = registry_dir
+        self.fallback_dir = fallback_dir
+        self._snapshot = None
+        self._swap_lock = threading.Lock()
+        self._watcher = None
+
+    @property
+    def snapshot(self):
+        """The live ModelSnapshot; read it once per request"""
+        if self._snapshot is None:
+            raise RuntimeError("No model version active. Call activate() first.")
+        return self._snapshot
+
+    def versions(self):
+        """Registry versions, oldest first"""
+        if not os.path.isdir(self.registry_dir):
+            return []
+        return sorted(
+            name for name in os.listdir(self.registry_dir)
+            if os.path.isfile(os.path.join(self.registry_dir, name, "best_model.pkl"))
+        )
+
+    def activate(self, version=None):
+        """Load, warm and publish a version (the newest if None); returns it"""
+        versions = self.versions()
+        if version is None:
+            version = versions[-1] if versions else "default"
+        directory = self.fallback_dir if version == "default" and not versions else os.path.join(self.registry_dir, version)
+
+        with self._swap_lock:
+            if self._snapshot is not None and self._snapshot.version == version:
+                return version
+            start = time.perf_counter()
+            snapshot = ModelSnapshot(directory, version)
+            snapshot.warm_up()
+            self._snapshot = snapshot
+        print(f"Model version {version} active (loaded and warmed in {time.perf_counter() - start:.2f}s)")
+        return version
+
+    def watch(self, interval_seconds):
+        """Poll the registry and activate new versions as they appear"""
+        if self._watcher is not None:
+            return
+
+        def poll():
+            while True:
+                time.sleep(interval_seconds)
+                try:
+                    versions = self.versions()
+                    if versions and versions[-1] != self.snapshot.version:
+                        self.activate(versions[-1])
+                except Exception as e:
+                    print(f"Error activating model version: {e}")
+
+        self._watcher = threading.Thread(target=poll, name="model-registry-watch", daemon=True)
+        self._watcher.start()
@@ -0,0 +1,179 @@
+"""Precomputed price lattice for the laptop predictor.
+
+Every input of the Gradio app comes from a finite set: the dropdown
+categories, the 0/1 radios and the stepped RAM and storage sliders. This
+module prices the whole grid (or a chosen subset) once, in batches, and
+stores it as a float64 .npy file plus a JSON sidecar describing the axes.
+At serve time the array is memory-mapped, so a request is an index
+computation and one read; values outside the grid return None and are left
+to the live model.
+
+    python price_lattice.py                      # full grid into build/
+    python price_lattice.py --Company Apple Dell --Ram 8 16
+"""
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+import util
+
+LATTICE_FILE = "price_lattice.npy"
+AXES_FILE = "price_lattice.json"
+# Generated files (~21MB for the full grid); build/ is git-ignored
+DEFAULT_DIR = os.environ.get("PRICE_LATTICE_DIR", os.path.join(os.path.dirname(__file__), "build"))
+BATCH_SIZE = 100_000
+
+# Lattice axis -> util.predict_prices argument, in array dimension order
+AXES = {
+    'Company': 'company',
+    'TypeName': 'type_name',
+    'Cpu brand': 'cpu_brand',
+    'Gpu brand': 'gpu_brand',
+    'os': 'os_type',
+    'Touchscreen': 'touchscreen',
+    'Ips': 'ips',
+    'Ram': 'ram',
+    'Total_Storage': 'total_storage'
+}
+
+
+def default_axes():
+    """Every value the Gradio inputs can produce, per axis"""
+    return {
+        'Company': util.get_company_names(),
+        'TypeName': util.get_type_names(),
+        'Cpu brand': util.get_cpu_brands(),
+        'Gpu brand': util.get_gpu_brands(),
+        'os': util.get_os_types(),
+        'Touchscreen': [0, 1],
+        'Ips': [0, 1],
+        'Ram': list(util.RAM_OPTIONS),
+        'Total_Storage': list(util.STORAGE_OPTIONS)
+    }
+
+
+def artifacts_fingerprint():
+    """SHA-256 of the live model version's model, column and scaler files"""
+    return util.get_model_fingerprint()
+
+
+def build_lattice(directory=DEFAULT_DIR, axes=None, batch_size=BATCH_SIZE):
+    """Price every grid point in batches and write the lattice files"""
+    axes = default_axes() if axes is None else axes
+    values = [axes[name] for name in AXES]
+    shape = tuple(len(axis) for axis in values)
+    total = int(np.prod(shape))
+
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, LATTICE_FILE)
+    # Per-process temporary names: concurrent builds never write the same file
+    tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+    lattice = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float64, shape=(total,))
+    columns = [np.asarray(axis, dtype=object) for axis in values]
+    for start in range(0, total, batch_size):
+        stop = min(start + batch_size, total)
+        positions = np.unravel_index(np.arange(start, stop), shape)
+        kwargs = {arg: column[index] for arg, column, index in zip(AXES.values(), columns, positions)}
+        lattice[start:stop] = util.predict_prices(**kwargs)
+    lattice.flush()
+    del lattice
+    os.replace(tmp_path, path)
+
+    # The sidecar is written last: a lattice without a matching sidecar is ignored
+    axes_path = os.path.join(directory, AXES_FILE)
+    tmp_axes_path = f"{axes_path}.{os.getpid()}.tmp"
+    with open(tmp_axes_path, "w") as f:
+        json.dump({
+            "axes": [[name, list(axes[name])] for name in AXES],
+            "fingerprint": artifacts_fingerprint()
+        }, f)
+    os.replace(tmp_axes_path, axes_path)
+    return total
+
+
+class PriceLattice:
+    """Memory-mapped grid of precomputed prices"""
+
+    def __init__(self, directory=DEFAULT_DIR):
+        with open(os.path.join(directory, AXES_FILE), "r") as f:
+            meta = json.load(f)
+        self.fingerprint = meta["fingerprint"]
+        self.axes = {name: values for name, values in meta["axes"]}
+        self._index = [{value: i for i, value in enumerate(values)} for _, values in meta["axes"]]
+        self.shape = tuple(len(values) for _, values in meta["axes"])
+        self.prices = np.load(os.path.join(directory, LATTICE_FILE), mmap_mode="r")
+        if self.prices.shape != (int(np.prod(self.shape)),):
+            raise ValueError("price lattice does not match its axes file")
+
+    def __len__(self):
+        return len(self.prices)
+
+    def is_current(self):
+        """True if the lattice was priced with the model version serving now"""
+        return self.fingerprint == artifacts_fingerprint()
+
+    def lookup(self, company, ram, touchscreen, ips, total_storage, type_name, cpu_brand, gpu_brand, os_type):
+        """Precomputed price for one configuration, or None if it is off the grid"""
+        request = {
+            'company': company, 'type_name': type_name, 'cpu_brand': cpu_brand,
+            'gpu_brand': gpu_brand, 'os_type': os_type, 'touchscreen': touchscreen,
+            'ips': ips, 'ram': ram, 'total_storage': total_storage
+        }
+        position = []
+        for index, arg in zip(self._index, AXES.values()):
+            i = index.get(request[arg])
+            if i is None:
+                return None
+            position.append(i)
+        return float(self.prices[np.ravel_multi_index(position, self.shape)])
+
+
+def load_lattice(directory=DEFAULT_DIR, build_missing=False):
+    """The lattice in directory, optionally (re)built if missing or stale; None if unavailable"""
+    try:
+        lattice = PriceLattice(directory)
+        if lattice.is_current():
+            return lattice
+        print("Price lattice is stale: model artifacts changed since it was built")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Error loading price lattice: {e}")
+
+    if not build_missing:
+        return None
+    print("Building price lattice...")
+    start = time.perf_counter()
+    count = build_lattice(directory)
+    print(f"Building price lattice...done ({count} prices in {time.perf_counter() - start:.1f}s)")
+    return PriceLattice(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute the laptop price lattice")
+    parser.add_argument("--output", default=DEFAULT_DIR, help="directory for the lattice files")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    for name in AXES:
+        numeric = name in ('Touchscreen', 'Ips', 'Ram', 'Total_Storage')
+        parser.add_argument(f"--{name.replace(' ', '-')}", dest=name, nargs="+", type=int if numeric else str,
+                            help=f"restrict the {name} axis to these values")
+    args = parser.parse_args()
+
+    util.load_saved_artifacts()
+    axes = default_axes()
+    for name in AXES:
+        if getattr(args, name):
+            axes[name] = getattr(args, name)
+
+    start = time.perf_counter()
+    count = build_lattice(args.output, axes, args.batch_size)
+    elapsed = time.perf_counter() - start
+    size_mb = os.path.getsize(os.path.join(args.output, LATTICE_FILE)) / 1024 / 1024
+    print(f"Priced {count} configurations in {elapsed:.1f}s ({count / elapsed:.0f}/s), {size_mb:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
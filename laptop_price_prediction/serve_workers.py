@@ -0,0 +1,70 @@
+"""Run several Gradio app workers that share one preloaded model.
+
+The parent imports gradio and the ML stack and loads the model once, then
+forks PRICE_WORKERS workers serving consecutive ports from
+GRADIO_SERVER_PORT (put the load balancer in front of those). Workers start
+from the parent's pages copy-on-write, so the interpreter, libraries and
+model are in memory once instead of once per worker, and a worker is ready
+in milliseconds instead of seconds.
+
+    PRICE_WORKERS=4 python serve_workers.py
+"""
+import gc
+import os
+import signal
+
+WORKERS = int(os.environ.get("PRICE_WORKERS", "2"))
+BASE_PORT = int(os.environ.get("GRADIO_SERVER_PORT", "7860"))
+
+
+def preload(import_gradio=True):
+    """Import and load everything workers share, then freeze it for forking"""
+    if import_gradio:
+        import gradio  # noqa: F401
+    import util
+    util.load_saved_artifacts()
+    if os.environ.get("PRICE_LATTICE", "0") == "1":
+        # Built once here; workers only open it instead of all building it at once
+        from price_lattice import load_lattice
+        load_lattice(build_missing=True)
+        os.environ["PRICE_LATTICE_BUILD"] = "0"
+    # The collector would otherwise write to every preloaded object and
+    # un-share its page in each worker
+    gc.freeze()
+
+
+def run_worker(port):
+    # Imported after the fork: the app starts threads (micro-batcher, model
+    # watch) that must belong to the worker
+    import app
+    app.demo.launch(server_port=port)
+
+
+def main():
+    preload()
+    workers = []
+    for i in range(WORKERS):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                run_worker(BASE_PORT + i)
+            finally:
+                os._exit(0)
+        workers.append(pid)
+    print(f"Started {WORKERS} workers on ports {BASE_PORT}-{BASE_PORT + WORKERS - 1}")
+
+    def stop(signum, frame):
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for pid in workers:
+        os.waitpid(pid, 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,137 +1,158 @@
-import json
-import pickle
+import numpy as np
 import pandas as pd
 import os
 import warnings
 warnings.filterwarnings("ignore")
 
-# Global variables to store loaded data
-__companies = None
-__type_names = None
-__cpu_brands = None
-__gpu_brands = None
-__os_types = None
-__numerical_features = None
-__model = None
-__scaler = None
-__columns = None
-
-def load_saved_artifacts():
-    """Load model, scaler, and feature columns from artifacts"""
+from model_registry import PricePredictor
+
+# Holds the live model version; set up by load_saved_artifacts
+__predictor = None
+
+# Values the app's RAM and storage sliders can produce
+RAM_OPTIONS = range(2, 65, 2)
+STORAGE_OPTIONS = range(128, 2001, 128)
+
+def load_saved_artifacts(version=None):
+    """Load and warm the model version from the registry (newest if None)
+
+    Without an artifacts/registry directory the model, scaler and feature
+    columns are read from artifacts/ as before.
+    """
     print("Loading saved artifacts...")
-    global __companies, __type_names, __cpu_brands, __gpu_brands, __os_types
-    global __numerical_features, __model, __scaler, __columns
-
-    # ✅ Use relative paths so it works on server or locally
-    base_path = os.path.join(os.path.dirname(__file__), "artifacts")
-
-    # Load feature columns
-    json_path = os.path.join(base_path, "input_columns.json")
-    with open(json_path, "r") as f:
-        all_columns = json.load(f)
-        __columns = all_columns
-
-        # Extract categories and remove prefixes
-        __companies = [col.replace("Company_", "") for col in all_columns if col.startswith("Company_")]
-        __type_names = [col.replace("TypeName_", "") for col in all_columns if col.startswith("TypeName_")]
-        __cpu_brands = [col.replace("Cpu brand_", "") for col in all_columns if col.startswith("Cpu brand_")]
-        __gpu_brands = [col.replace("Gpu brand_", "") for col in all_columns if col.startswith("Gpu brand_")]
-        __os_types = [col.replace("os_", "") for col in all_columns if col.startswith("os_")]
-
-        # Extract numerical features
-        prefixed_columns = ["Company_", "TypeName_", "Cpu brand_", "Gpu brand_", "os_"]
-        __numerical_features = [col for col in all_columns if not any(col.startswith(prefix) for prefix in prefixed_columns)]
-
-    # Load model
-    import joblib
-    model_path = os.path.join(base_path, "best_model.pkl")
-    __model = joblib.load(model_path)
-
-    # Load scaler (optional)
-    scaler_path = os.path.join(base_path, "scaler.pkl")
-    if os.path.exists(scaler_path):
-        with open(scaler_path, 'rb') as f:
-            __scaler = pickle.load(f)
+    global __predictor
+    if __predictor is None:
+        __predictor = PricePredictor()
+    __predictor.activate(version or os.environ.get("PRICE_MODEL_VERSION"))
+    if __predictor.snapshot.scaler is not None:
         print("Scaler loaded successfully")
     else:
         print("Warning: scaler.pkl not found. Numeric features won't be scaled.")
-        __scaler = None
-
     print("Loading saved artifacts...done")
 
+def get_predictor():
+    return __predictor
+
+def activate_model_version(version=None):
+    """Hot-swap to another registry version (newest if None) without a restart"""
+    return __predictor.activate(version)
+
+def _snapshot():
+    if __predictor is None:
+        return None
+    return __predictor.snapshot
+
 def get_company_names():
-    return __companies
+    return _snapshot().categories['Company'] if _snapshot() else None
 
 def get_type_names():
-    return __type_names
+    return _snapshot().categories['TypeName'] if _snapshot() else None
 
 def get_cpu_brands():
-    return __cpu_brands
+    return _snapshot().categories['Cpu brand'] if _snapshot() else None
 
 def get_gpu_brands():
-    return __gpu_brands
+    return _snapshot().categories['Gpu brand'] if _snapshot() else None
 
 def get_os_types():
-    return __os_types
+    return _snapshot().categories['os'] if _snapshot() else None
 
 def get_numerical_features():
-    return __numerical_features
+    return list(_snapshot().numeric) if _snapshot() else None
 
 def get_model():
-    return __model
+    return _snapshot().model if _snapshot() else None
 
-def predict_price(model, laptop_features, columns):
-    """Prediction function"""
-    features_df = pd.DataFrame([laptop_features])
+def get_model_version():
+    return _snapshot().version if _snapshot() else None
 
-    # One-Hot Encode categorical features
-    categorical_cols = ['Company', 'TypeName', 'Cpu brand', 'Gpu brand', 'os']
-    features_df = pd.get_dummies(features_df, columns=categorical_cols, drop_first=True, dtype=int)
+def get_model_fingerprint():
+    """SHA-256 of the live version's model, column and scaler files"""
+    return _snapshot().fingerprint if _snapshot() else None
 
-    # Ensure all columns exist
-    for col in columns:
-        if col not in features_df.columns:
-            features_df[col] = 0
+def encode_features(laptop_features):
+    """Encode laptop features into the live model's input matrix
 
-    # Reorder to match training
-    features_df = features_df[columns]
+    laptop_features maps each raw feature name ('Company', 'Ram', ...) to a
+    single value or to a sequence/array with one value per laptop; single
+    values are repeated for every row.
+    """
+    return __predictor.snapshot.encode(laptop_features)
 
-    # Scale numeric features
-    numeric_cols = ['Ram', 'Total_Storage']
-    if __scaler is not None:
-        features_df[numeric_cols] = __scaler.transform(features_df[numeric_cols])
-    else:
-        print("Warning: No scaler available. Using raw numeric values.")
-
-    # Drop unwanted columns
-    for col in ['Price', 'index']:
-        if col in features_df.columns:
-            features_df = features_df.drop(columns=[col])
-
-    predicted_price = model.predict(features_df)
-    return predicted_price[0]
+def predict_price(model, laptop_features, columns):
+    """Prediction function (columns must be the live version's columns)"""
+    return model.predict(encode_features(laptop_features))[0]
+
+def predict_prices(company, ram, touchscreen, ips, total_storage, type_name, cpu_brand, gpu_brand, os_type):
+    """Estimate prices for many laptops with a single model call
+
+    Each argument is a sequence or array with one value per laptop, or a
+    single value shared by all of them. Returns a float array of prices
+    rounded like get_estimated_price.
+    """
+    if __predictor is None:
+        raise RuntimeError("Model or columns not loaded. Call load_saved_artifacts() first.")
+
+    # One snapshot for the whole call, even if a new version goes live meanwhile
+    snapshot = __predictor.snapshot
+    predictions = snapshot.predict({
+        'Company': company,
+        'Ram': ram,
+        'Touchscreen': touchscreen,
+        'Ips': ips,
+        'Total_Storage': total_storage,
+        'TypeName': type_name,
+        'Cpu brand': cpu_brand,
+        'Gpu brand': gpu_brand,
+        'os': os_type
+    })
+    # Python's round, exactly as the single-laptop path has always rounded
+    return np.array([round(price, 2) for price in predictions.tolist()])
+
+def price_sensitivity(company, ram, touchscreen, ips, total_storage, type_name, cpu_brand, gpu_brand, os_type):
+    """Price curves around a base configuration from one batched model call
+
+    Returns a dict of DataFrames, one per varied feature: every RAM step,
+    every storage step, and each CPU and GPU brand, with the other features
+    held at the base values. Each has the feature column and a 'Price'
+    column.
+    """
+    base = {
+        'company': company, 'ram': ram, 'touchscreen': touchscreen, 'ips': ips,
+        'total_storage': total_storage, 'type_name': type_name, 'cpu_brand': cpu_brand,
+        'gpu_brand': gpu_brand, 'os_type': os_type
+    }
+    sweeps = {
+        'Ram': ('ram', list(RAM_OPTIONS)),
+        'Total_Storage': ('total_storage', list(STORAGE_OPTIONS)),
+        'Cpu brand': ('cpu_brand', get_cpu_brands()),
+        'Gpu brand': ('gpu_brand', get_gpu_brands())
+    }
+
+    # Stack all sweeps into one batch: each row is the base with one feature changed
+    batch = {arg: [] for arg in base}
+    for arg, values in sweeps.values():
+        for value in values:
+            for name in base:
+                batch[name].append(value if name == arg else base[name])
+    prices = predict_prices(**batch)
+
+    curves, start = {}, 0
+    for feature, (_, values) in sweeps.items():
+        curves[feature] = pd.DataFrame({feature: values, 'Price': prices[start:start + len(values)]})
+        start += len(values)
+    return curves
 
 def get_estimated_price(company, ram, touchscreen, ips, total_storage, type_name, cpu_brand, gpu_brand, os_type):
     """Estimate price"""
-    if __model is None or __columns is None:
+    if __predictor is None:
         print("Model or columns not loaded. Call load_saved_artifacts() first.")
         return None
 
     try:
-        laptop_features = {
-            'Company': company,
-            'Ram': ram,
-            'Touchscreen': touchscreen,
-            'Ips': ips,
-            'Total_Storage': total_storage,
-            'TypeName': type_name,
-            'Cpu brand': cpu_brand,
-            'Gpu brand': gpu_brand,
-            'os': os_type
-        }
-
-        estimated_price = predict_price(__model, laptop_features, __columns)
-        estimated_price = round(estimated_price, 2)
+        estimated_price = float(predict_prices(
+            company, ram, touchscreen, ips, total_storage, type_name, cpu_brand, gpu_brand, os_type
+        )[0])
 
         print(f"Estimated price for {company} laptop: ${estimated_price}")
         return estimated_price
@@ -143,26 +164,28 @@ def get_estimated_price(company, ram, touchscreen, ips, total_storage, type_name
 def validate_inputs(company, type_name, cpu_brand, gpu_brand, os_type):
     """Validate input values"""
     validation = {'valid': True, 'errors': []}
+    companies, type_names = get_company_names(), get_type_names()
+    cpu_brands, gpu_brands, os_types = get_cpu_brands(), get_gpu_brands(), get_os_types()
 
-    if company not in __companies:
+    if company not in companies:
         validation['valid'] = False
-        validation['errors'].append(f"Company '{company}' not found. Available: {__companies}")
+        validation['errors'].append(f"Company '{company}' not found. Available: {companies}")
 
-    if type_name not in __type_names:
+    if type_name not in type_names:
         validation['valid'] = False
-        validation['errors'].append(f"Type '{type_name}' not found. Available: {__type_names}")
+        validation['errors'].append(f"Type '{type_name}' not found. Available: {type_names}")
 
-    if cpu_brand not in __cpu_brands:
+    if cpu_brand not in cpu_brands:
         validation['valid'] = False
-        validation['errors'].append(f"CPU brand '{cpu_brand}' not found. Available: {__cpu_brands}")
+        validation['errors'].append(f"CPU brand '{cpu_brand}' not found. Available: {cpu_brands}")
 
-    if gpu_brand not in __gpu_brands:
+    if gpu_brand not in gpu_brands:
         validation['valid'] = False
-        validation['errors'].append(f"GPU brand '{gpu_brand}' not found. Available: {__gpu_brands}")
+        validation['errors'].append(f"GPU brand '{gpu_brand}' not found. Available: {gpu_brands}")
 
-    if os_type not in __os_types:
+    if os_type not in os_types:
         validation['valid'] = False
-        validation['errors'].append(f"OS type '{os_type}' not found. Available: {__os_types}")
+        validation['errors'].append(f"OS type '{os_type}' not found. Available: {os_types}")
 
     return validation
 
@@ -175,18 +198,20 @@ if __name__ == '__main__':
     print(f"GPU Brands: {get_gpu_brands()}")
     print(f"Operating Systems: {get_os_types()}")
     print(f"Numerical Features: {get_numerical_features()}")
-    print(f"Model loaded: {__model is not None}")
+    print(f"Model loaded: {get_model() is not None} (version {get_model_version()})")
 
     print("\n=== Test Prediction ===")
-    if __companies and __type_names and __cpu_brands and __gpu_brands and __os_types:
+    companies, type_names = get_company_names(), get_type_names()
+    cpu_brands, gpu_brands, os_types = get_cpu_brands(), get_gpu_brands(), get_os_types()
+    if companies and type_names and cpu_brands and gpu_brands and os_types:
         test_price = get_estimated_price(
-            company=__companies[0],
+            company=companies[0],
             ram=8,
             touchscreen=1,
             ips=1,
             total_storage=256,
-            type_name=__type_names[0],
-            cpu_brand=__cpu_brands[0],
-            gpu_brand=__gpu_brands[0],
-            os_type=__os_types[0]
+            type_name=type_names[0],
+            cpu_brand=cpu_brands[0],
+            gpu_brand=gpu_brands[0],
+            os_type=os_types[0]
         )
@@ -0,0 +1,146 @@
+"""Resident memory and startup time of N predictor workers, per loading mode.
+
+    pickle  every worker joblib-loads best_model.pkl (the default)
+    fork    serve_workers.preload() in one parent, then the workers are forked
+
+Memory is read from /proc/<pid>/smaps_rollup while all workers are alive:
+RSS counts shared pages in full, PSS splits them between the processes
+sharing them (so the PSS column sums to the real total) and USS is the
+memory only that worker holds. Linux only.
+
+    python worker_memory.py --workers 4
+    python worker_memory.py --workers 4 --app     # import the Gradio app too
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from serve_workers import preload
+
+MODES = ("pickle", "fork")
+
+
+def memory(pid):
+    """RSS, PSS and USS of a process in MB"""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {
+        "rss_mb": fields["Rss"],
+        "pss_mb": fields["Pss"],
+        "uss_mb": fields["Private_Clean"] + fields["Private_Dirty"]
+    }
+
+
+def read_report(stream):
+    """The worker's JSON line, skipping what util prints while loading"""
+    for line in stream:
+        if line.startswith("{"):
+            return json.loads(line)
+    raise RuntimeError("worker exited before it was ready")
+
+
+def serve(import_app, started):
+    """Worker body: load the predictor (or app), report readiness, wait for stdin to close"""
+    start = time.perf_counter()
+    if import_app:
+        import app  # noqa: F401
+    import util
+    util.load_saved_artifacts()
+    util.get_estimated_price('Dell', 8, 0, 1, 512, 'Notebook', 'Intel Core i5', 'Nvidia', 'Windows')
+    report = {"pid": os.getpid(), "load_s": time.perf_counter() - start, "ready_s": time.time() - started}
+    print(json.dumps(report), flush=True)
+    sys.stdin.read()
+
+
+def run_spawned(workers, import_app):
+    args = [sys.executable, os.path.abspath(__file__), "--worker"] + (["--app"] if import_app else [])
+    procs = [subprocess.Popen(args + ["--started", str(time.time())], stdin=subprocess.PIPE,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)))
+             for _ in range(workers)]
+    reports = [read_report(proc.stdout) for proc in procs]
+    for report in reports:
+        report.update(memory(report["pid"]))
+    for proc in procs:
+        proc.stdin.close()
+        proc.wait()
+    return reports
+
+
+def run_forked(workers, import_app):
+    start = time.perf_counter()
+    preload(import_gradio=import_app)
+    print(f"fork    parent preload={(time.perf_counter() - start) * 1000:.0f}ms")
+    pipes = []
+    for _ in range(workers):
+        started = time.time()
+        read_fd, write_fd = os.pipe()
+        stdin_read, stdin_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.close(stdin_write)
+            # Earlier workers' pipes would otherwise never see EOF
+            for _, out, other_stdin in pipes:
+                out.close()
+                os.close(other_stdin)
+            os.dup2(write_fd, 1)
+            os.dup2(stdin_read, 0)
+            sys.stdout = os.fdopen(1, "w")
+            sys.stdin = os.fdopen(0, "r")
+            serve(import_app, started)
+            os._exit(0)
+        os.close(write_fd)
+        os.close(stdin_read)
+        pipes.append((pid, os.fdopen(read_fd), stdin_write))
+
+    reports = []
+    for pid, out, _ in pipes:
+        reports.append(read_report(out))
+    for report in reports:
+        report.update(memory(report["pid"]))
+    for pid, out, stdin_write in pipes:
+        os.close(stdin_write)
+        os.waitpid(pid, 0)
+        out.close()
+    return reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-worker memory and startup time by model loading mode")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--app", action="store_true", help="workers import the Gradio app, not just util")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--started", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        serve(args.app, args.started)
+        return
+
+    # fork last: it preloads into this process
+    for mode in sorted(args.modes, key=MODES.index):
+        if mode == "fork":
+            reports = run_forked(args.workers, args.app)
+        else:
+            reports = run_spawned(args.workers, args.app)
+        n = len(reports)
+        print(f"{mode:<7} workers={n} "
+              f"rss={sum(r['rss_mb'] for r in reports) / n:.1f}MB "
+              f"pss={sum(r['pss_mb'] for r in reports) / n:.1f}MB "
+              f"uss={sum(r['uss_mb'] for r in reports) / n:.1f}MB per worker, "
+              f"total pss={sum(r['pss_mb'] for r in reports):.1f}MB, "
+              f"worker load={max(r['load_s'] for r in reports) * 1000:.0f}ms, "
+              f"ready after={max(r['ready_s'] for r in reports) * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()